@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import (Executor, ProcessPoolExecutor,
+                                ThreadPoolExecutor, as_completed)
 from enum import Enum, auto
-from typing import Iterable, Protocol
+from typing import Any, Callable, Iterable, Protocol
 
 
 class Label(Protocol):
@@ -29,103 +33,200 @@ class NodeStatus(Enum):
     DONE = auto()
 
 
-@dataclass
-class Node:
-    label: Label
-    status: NodeStatus = NodeStatus.PENDING
-    ancestors: set[Label] = field(default_factory=set)
-    descendants: set[Label] = field(default_factory=set)
+PENDING = NodeStatus.PENDING.value
+READY = NodeStatus.READY.value
+ACTIVE = NodeStatus.ACTIVE.value
+DONE = NodeStatus.DONE.value
 
 
 class ComputationalDAG:
+    """Nodes with dependencies, scheduled by Kahn's algorithm.
+
+    Every node counts its ancestors that are not done; a defined node whose
+    count drops to zero is put into the ready queue. Nodes that are only
+    known as dependencies never become ready, neither do their descendants.
+
+    Labels are interned to consecutive integers. Statuses, flags and
+    counters are kept in flat arrays indexed by them, descendants in one
+    integer array per node.
+    """
+
     def __init__(self, precomputed_nodes: Iterable[Label] | None = None) -> None:
-        self.nodes: dict[Label, Node] = (
-            {
-                label: Node(label=label, status=NodeStatus.DONE)
-                for label in precomputed_nodes
-            }
-            if precomputed_nodes
-            else {}
-        )
+        self.index: dict[Label, int] = {}
+        self.labels: list[Label] = []
+        self.status = bytearray()
+        # 0 for nodes only known as a dependency of another node
+        self.defined = bytearray()
+        # number of ancestors not done yet
+        self.pending = array("q")
+        self.descendants: list[array] = []
+        self.ready: deque[int] = deque()
+
+        for label in precomputed_nodes or ():
+            i = self._intern(label)
+            self.status[i] = DONE
+            self.defined[i] = 1
+
+    def _intern(self, label: Label) -> int:
+        i = self.index.get(label)
+        if i is None:
+            i = self.index[label] = len(self.labels)
+            self.labels.append(label)
+            self.status.append(PENDING)
+            self.defined.append(0)
+            self.pending.append(0)
+            self.descendants.append(array("q"))
+        return i
+
+    def __contains__(self, label: Label) -> bool:
+        return label in self.index
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def get_status(self, label: Label) -> NodeStatus:
+        return NodeStatus(self.status[self.index[label]])
 
     def add_node(
         self, node: Label, depends_on: Iterable[Label] | None = None
     ) -> None:
-        if node in self.nodes and self.nodes[node].status in {
-            NodeStatus.DONE,
-            NodeStatus.ACTIVE,
-        }:
+        i = self._intern(node)
+        if self.status[i] in (DONE, ACTIVE):
             raise NodeStatusError(
-                f"Node {node!r} already has status {self.nodes[node].status}"
+                f"Node {node!r} already has status {NodeStatus(self.status[i])}"
             )
-        elif node not in self.nodes:
-            self.nodes[node] = Node(label=node)
-
-        if depends_on:
-            self.nodes[node].ancestors |= set(depends_on)
-            for dependence in depends_on:
-                if dependence not in self.nodes:
-                    self.nodes[dependence] = Node(label=dependence)
-                self.nodes[dependence].descendants.add(node)
-        else:
-            self.nodes[node].status = NodeStatus.READY
-
-    def _get_uncomputable_nodes(self) -> set:
-        uncomputable = set()
-        stack = [
-            node
-            for node in self.nodes.values()
-            if node.status == NodeStatus.PENDING and not node.ancestors
-        ]
-        while stack:
-            node = stack.pop()
-            uncomputable.add(node.label)
-            for v in node.descendants:
-                stack.append(self.nodes[v])
-        return uncomputable
 
-    def iter_computable_nodes(self):
-        ordered: list[Label] = []
-        waiting: list[Node] = []
-        permanents: set[Label] = set()
-        temporaries: set[Label] = set()
-
-        def visit(v: Node) -> None:
-            if v.label in permanents:
-                return
-            if v.label in temporaries:
-                raise CycleError(v.label)
-            temporaries.add(v.label)
-            for label in v.descendants:
-                if self.nodes[label].status != NodeStatus.PENDING:
-                    visit(self.nodes[label])
-            temporaries.remove(v.label)
-            permanents.add(v.label)
-            if v.status in {NodeStatus.ACTIVE, NodeStatus.READY}:
-                ordered.append(v.label)
-
-        uncomputable = self._get_uncomputable_nodes()
-        for node in self.nodes.values():
-            if node.status in {NodeStatus.DONE, NodeStatus.READY}:
-                waiting.append(node)
-            elif node.label not in uncomputable:
-                node.status = NodeStatus.ACTIVE
-
-        while waiting:
-            node = waiting.pop()
-            if node.label in permanents:
+        redefined = self.defined[i]
+        self.defined[i] = 1
+        for dependence in dict.fromkeys(depends_on or ()):
+            j = self._intern(dependence)
+            if redefined and i in self.descendants[j]:
                 continue
-            visit(node)
+            self.descendants[j].append(i)
+            if self.status[j] != DONE:
+                self.pending[i] += 1
+
+        if self.pending[i]:
+            self.status[i] = PENDING
+        elif self.status[i] != READY:
+            self.status[i] = READY
+            self.ready.append(i)
 
-        yield from reversed(ordered)
+    def add_precomputed_nodes(self, nodes: Iterable[Label]) -> None:
+        """Marks nodes computed outside of the DAG as done."""
 
-        for node in self.nodes.values():
-            if node.status == NodeStatus.ACTIVE:
-                node.status = NodeStatus.PENDING
+        for label in nodes:
+            i = self._intern(label)
+            self.defined[i] = 1
+            self._done(i)
+
+    def iter_computable_nodes(self):
+        """Yields ready nodes. The caller marks each of them done before
+        taking the next one, which may make further nodes ready."""
+
+        while self.ready:
+            i = self.ready.popleft()
+            if self.status[i] != READY:
+                continue
+            self.status[i] = ACTIVE
+            yield self.labels[i]
 
     def done(self, node: Label) -> None:
-        self.nodes[node].status = NodeStatus.DONE
+        self._done(self.index[node])
+
+    def _done(self, i: int) -> None:
+        if self.status[i] == DONE:
+            return
+        self.status[i] = DONE
+        for j in self.descendants[i]:
+            self.pending[j] -= 1
+            if not self.pending[j] and self.defined[j] and self.status[j] == PENDING:
+                self.status[j] = READY
+                self.ready.append(j)
+
+    def check_cycles(self) -> None:
+        """Raises CycleError if the nodes not done yet contain a cycle.
+
+        Depth-first search with an explicit stack of descendant iterators,
+        nodes on the current path are marked as visiting.
+        """
+
+        visiting, visited = 1, 2
+        marks = bytearray(len(self.labels))
+        for root in range(len(self.labels)):
+            if marks[root] or self.status[root] == DONE:
+                continue
+            marks[root] = visiting
+            stack = [(root, iter(self.descendants[root]))]
+            while stack:
+                i, descendants = stack[-1]
+                for j in descendants:
+                    if self.status[j] == DONE or marks[j] == visited:
+                        continue
+                    if marks[j] == visiting:
+                        raise CycleError(self.labels[j])
+                    marks[j] = visiting
+                    stack.append((j, iter(self.descendants[j])))
+                    break
+                else:
+                    marks[i] = visited
+                    stack.pop()
 
     @property
     def undone_count(self) -> int:
-        return sum(node.status != NodeStatus.DONE for node in self.nodes.values())
+        return len(self.status) - self.status.count(DONE)
+
+
+# Levels smaller than this are evaluated in the calling process.
+PARALLEL_MIN_LEVEL = 16
+
+
+def make_executor(workers: int) -> Executor:
+    """Process pool, or a thread pool if the interpreter runs without GIL."""
+
+    if getattr(sys, "_is_gil_enabled", lambda: True)():
+        return ProcessPoolExecutor(workers)
+    return ThreadPoolExecutor(workers)
+
+
+def _run_batch(tasks: list[Callable[[], Any]]) -> list[Any]:
+    return [task() for task in tasks]
+
+
+def run_parallel(
+    dag: ComputationalDAG,
+    make_task: Callable[[Label], Callable[[], Any]],
+    on_result: Callable[[Label, Any], None],
+    executor: Executor,
+    workers: int,
+) -> None:
+    """Evaluates the computable nodes of the DAG level by level.
+
+    All nodes ready at a time form a level. make_task builds a picklable
+    callable for each of them, the level is split into one batch per
+    worker to save on inter-process communication. Results of a batch are
+    passed to on_result and the nodes are marked done as soon as the batch
+    returns; the nodes this makes ready form the next level.
+    """
+
+    while True:
+        level = list(dag.iter_computable_nodes())
+        if not level:
+            return
+        if len(level) < PARALLEL_MIN_LEVEL:
+            for label in level:
+                on_result(label, make_task(label)())
+                dag.done(label)
+            continue
+
+        size = -(-len(level) // workers)
+        batches = {
+            executor.submit(
+                _run_batch, [make_task(label) for label in level[i : i + size]]
+            ): level[i : i + size]
+            for i in range(0, len(level), size)
+        }
+        for future in as_completed(batches):
+            for label, value in zip(batches[future], future.result()):
+                on_result(label, value)
+                dag.done(label)
@@ -1,35 +1,137 @@
 from fractions import Fraction
+from itertools import pairwise
+from typing import Any, Generator, Iterable, Optional
 
+from functions.newton import NewtonPolynomial
 from functions.polynomial import Polynomial
 from number import factorial
-from table import GetterFn, Table, empty
+from table import Table, TrapezoidTable
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Differences of values below 2^62 in absolute value fit into int64.
+INT64_SAFE_BOUND = 2**62
+
+
+def _fits_int64(values: list) -> bool:
+    return (
+        set(map(type, values)) == {int}
+        and -INT64_SAFE_BOUND < min(values)
+        and max(values) < INT64_SAFE_BOUND
+    )
+
+
+def _iter_rows(row: list, use_numpy: Optional[bool]) -> Generator[Any, None, None]:
+    """Difference rows as int64 arrays by np.diff while their values are
+    small enough, then as lists of Python numbers."""
+
+    if use_numpy is None:
+        use_numpy = np is not None
+    elif use_numpy and np is None:
+        raise ImportError("use_numpy=True needs numpy installed")
+    if use_numpy and _fits_int64(row):
+        array = np.array(row, dtype=np.int64)
+        while array.size and array.any():
+            if array.min() <= -INT64_SAFE_BOUND or array.max() >= INT64_SAFE_BOUND:
+                row = array.tolist()
+                break
+            yield array
+            array = np.diff(array)
+        else:
+            return
+
+    while row and not all(value == 0 for value in row):
+        yield row
+        row = [b - a for a, b in pairwise(row)]
+
+
+def iter_difference_rows(
+    sequence: Iterable, use_numpy: Optional[bool] = None
+) -> Generator[list, None, None]:
+    """Rows of the difference table, each computed from the previous one.
+
+    Stops before the first row of zeros, so only one row is kept at a time.
+    Integer sequences fitting into int64 are differenced with NumPy unless
+    use_numpy is False, rows that could overflow fall back to Python ints.
+    """
+
+    for values in _iter_rows(list(sequence), use_numpy):
+        yield values if isinstance(values, list) else values.tolist()
+
+
+def _diagonal(sequence: Iterable, use_numpy: Optional[bool], index: int) -> list:
+    return [
+        values[index] if isinstance(values, list) else int(values[index])
+        for values in _iter_rows(list(sequence), use_numpy)
+    ]
 
-def build_difference_table(sequence: list) -> Table:
-    def filler(i: int, j: int, T: GetterFn):
-        if i == 0:
-            return sequence[j]
-        if j < n - i:
-            return T((i - 1, j + 1)) - T((i - 1, j))
-        return empty
 
+def newton_coefficients(sequence: Iterable, use_numpy: Optional[bool] = None) -> list:
+    """First column of the difference table, coefficients of the Newton
+    forward difference polynomial."""
+
+    return _diagonal(sequence, use_numpy, 0)
+
+
+def continue_sequence(
+    sequence: Iterable, count: int, use_numpy: Optional[bool] = None
+) -> list:
+    """Next count terms of a sequence given by a polynomial.
+
+    The last entries of the difference rows form a diagonal of the table,
+    each step adds every entry to the one above it, the top entry is the
+    next term.
+    """
+
+    diagonal = _diagonal(sequence, use_numpy, -1)
+    res = []
+    for _ in range(count):
+        for k in range(len(diagonal) - 2, -1, -1):
+            diagonal[k] += diagonal[k + 1]
+        res.append(diagonal[0] if diagonal else 0)
+    return res
+
+
+def build_difference_table(sequence: list) -> Table:
     n = len(sequence)
-    difference_table = Table(n, n, filler)
-    difference_table.truncate_zero_rows()
+    rows = list(iter_difference_rows(sequence))
+    difference_table = TrapezoidTable(len(rows), n, lambda i: (0, n - i))
+    for i, row in enumerate(rows):
+        difference_table.set_row(i, row)
     return difference_table
 
-def make_newton_polynomial(differences) -> Polynomial:
+def make_newton_polynomial(
+    differences, basis: str = "monomial"
+) -> Polynomial | NewtonPolynomial:
+    """Polynomial with the given forward differences at 0, 1, 2, ...
+
+    basis="newton" keeps it in the binomial basis, "monomial" converts it
+    by divide and conquer, "sum" adds up the falling factorial polynomials
+    term by term.
+    """
+
+    if basis == "newton":
+        return NewtonPolynomial(differences)
+    if basis == "monomial":
+        return NewtonPolynomial(differences).to_polynomial()
+    if basis != "sum":
+        raise ValueError(f"Unknown basis {basis!r}")
+
     res = Polynomial()
     for i, difference in enumerate(differences):
         res += Fraction(difference, factorial(i)) * Polynomial.falling_factorial(i)
 
     return res
 
+
 if __name__ == "__main__":
-    DT = build_difference_table([i**2 for i in range(1, 10)])
-    difference0 = DT.get_col(0)
-    newton = make_newton_polynomial(difference0)
-    continuation = [newton(i) for i in range(10, 15)]
+    sequence = [i**2 for i in range(1, 10)]
+    DT = build_difference_table(sequence)
+    newton = make_newton_polynomial(newton_coefficients(sequence))
+    continuation = continue_sequence(sequence, 5)
 
     print(DT)
     print()
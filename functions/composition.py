@@ -0,0 +1,46 @@
+"""Taylor shift and composition of integer coefficient lists."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from functions.multiplication import mul_integers
+
+
+def taylor_shift(p: Sequence[int], a: int) -> list[int]:
+    """Coefficients of p(x + a) by repeated synthetic division."""
+
+    res = list(p)
+    n = len(res) - 1
+    if a == 0:
+        return res
+    for i in range(n):
+        for j in range(n - 1, i - 1, -1):
+            res[j] += a * res[j + 1]
+    return res
+
+
+def compose_integers(p: Sequence[int], q: Sequence[int]) -> list[int]:
+    """Coefficients of p(q(x)) by divide and conquer.
+
+    p = p_low + x^m p_high is evaluated as p_low(q) + q^m p_high(q), with
+    m a power of two and the powers q^m computed once by squaring.
+    """
+
+    powers = [list(q)]
+    while 1 << len(powers) < len(p):
+        powers.append(mul_integers(powers[-1], powers[-1]))
+
+    def evaluate(start: int, level: int) -> list[int]:
+        if level == 0:
+            return [p[start]]
+        half = 1 << (level - 1)
+        low = evaluate(start, level - 1)
+        if start + half >= len(p):
+            return low
+        high = mul_integers(evaluate(start + half, level - 1), powers[level - 1])
+        for i, c in enumerate(low):
+            high[i] += c
+        return high
+
+    return evaluate(0, len(powers))
@@ -0,0 +1,65 @@
+"""Power series inversion and division of coefficient lists."""
+
+from __future__ import annotations
+
+import math
+from fractions import Fraction
+from typing import Sequence
+
+from functions.multiplication import Number, multiply
+
+
+def series_inverse(f: Sequence[Number], n: int) -> list[Number]:
+    """First n coefficients of the power series 1/f, f[0] must be non-zero.
+
+    Newton iteration g <- g - g (f g - 1), doubling the precision each step.
+    """
+
+    if f[0] == 0:
+        raise ZeroDivisionError("Constant term of the series is zero")
+
+    g: list[Number] = [Fraction(1) / f[0]]
+    precision = 1
+    while precision < n:
+        new_precision = min(2 * precision, n)
+        fg = multiply(f[:new_precision], g)
+        # f g = 1 + O(x^precision), only the next terms are needed
+        error = fg[precision:new_precision]
+        correction = multiply(g[: new_precision - precision], error)
+        g.extend(-c for c in correction[: new_precision - precision])
+        g.extend([0] * (new_precision - len(g)))
+        precision = new_precision
+    return g[:n]
+
+
+def divmod_integer(
+    a: Sequence[int], b: Sequence[int]
+) -> tuple[list[int], list[int], int]:
+    """Long division of integer lists: a = (q b + r) / d with deg r < deg b.
+
+    The dividend is only scaled when a leading term is not divisible by the
+    leading coefficient of b, so monic divisors need no scaling at all.
+    """
+
+    lc = b[-1]
+    db = len(b) - 1
+    r = list(a)
+    q = [0] * (len(a) - db)
+    d = 1
+    for k in range(len(a) - 1, db - 1, -1):
+        t = r[k]
+        if t == 0:
+            continue
+        mult = abs(lc) // math.gcd(t, lc)
+        if mult != 1:
+            r = [c * mult for c in r[: k + 1]]
+            q = [c * mult for c in q]
+            d *= mult
+            t *= mult
+        factor = t // lc
+        shift = k - db
+        for i, c in enumerate(b):
+            r[shift + i] -= factor * c
+        q[shift] = factor
+    return q, r[:db] or [0], d
+
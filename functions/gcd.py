@@ -0,0 +1,182 @@
+"""Greatest common divisor of coefficient lists (lowest power first).
+
+Both algorithms work on the primitive integer parts of the inputs and
+return the gcd as a primitive integer list with positive leading
+coefficient.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from fractions import Fraction
+from typing import Sequence
+
+from functions.division import divmod_integer
+from functions.multiplication import Number
+from number import crt, iter_primes_below, rational_reconstruction
+
+PRIME_BOUND = 2**31
+_primes: list[int] = []
+_primes_lock = threading.Lock()
+
+
+def iter_primes():
+    """Descending primes below PRIME_BOUND, remembered between calls.
+
+    Iterators may be interleaved or run in several threads, the cache is
+    only extended by the one reaching its end, under a lock.
+    """
+
+    i = 0
+    while True:
+        if i == len(_primes):
+            with _primes_lock:
+                if i == len(_primes):
+                    start = _primes[-1] if _primes else PRIME_BOUND
+                    _primes.append(next(iter_primes_below(start)))
+        yield _primes[i]
+        i += 1
+
+
+def primitive_part(coefficients: Sequence[Number]) -> list[int]:
+    """Integer polynomial with coprime coefficients proportional to the input,
+    without zero leading coefficients."""
+
+    factor = math.lcm(
+        *[c.denominator for c in coefficients if isinstance(c, Fraction)]
+    )
+    integers = [int(c * factor) for c in coefficients]
+    content = math.gcd(*integers)
+    if content > 1:
+        integers = [c // content for c in integers]
+    return _trim(integers)
+
+
+def _trim(coefficients: list[int]) -> list[int]:
+    while len(coefficients) > 1 and coefficients[-1] == 0:
+        coefficients.pop()
+    return coefficients
+
+
+def _normalize_sign(coefficients: list[int]) -> list[int]:
+    if coefficients[-1] < 0:
+        return [-c for c in coefficients]
+    return coefficients
+
+
+def _remainder_mod_p(a: list[int], b: list[int], p: int) -> list[int]:
+    r = a.copy()
+    inverse = pow(b[-1], -1, p)
+    db = len(b) - 1
+    for k in range(len(r) - 1, db - 1, -1):
+        factor = r[k] * inverse % p
+        if factor:
+            shift = k - db
+            for i, c in enumerate(b):
+                r[shift + i] = (r[shift + i] - factor * c) % p
+    return _trim(r[:db] if db else [0])
+
+
+def gcd_mod_p(a: Sequence[int], b: Sequence[int], p: int) -> list[int]:
+    """Monic gcd of integer polynomials reduced modulo a prime p."""
+
+    x = _trim([c % p for c in a])
+    y = _trim([c % p for c in b])
+    while y != [0]:
+        x, y = y, _remainder_mod_p(x, y, p)
+    inverse = pow(x[-1], -1, p)
+    return [c * inverse % p for c in x]
+
+
+def _divides(divisor: Sequence[int], dividend: Sequence[int]) -> bool:
+    _, remainder, _ = divmod_integer(dividend, divisor)
+    return all(c == 0 for c in remainder)
+
+
+def gcd_modular(a: Sequence[Number], b: Sequence[Number]) -> list[int]:
+    """Multi-modular gcd: gcds modulo word-size primes, combined by CRT.
+
+    Coefficients of the monic gcd are recovered by rational reconstruction.
+    Primes dividing a leading coefficient are skipped, primes giving a gcd
+    of too large degree are unlucky and discarded. Once the reconstruction
+    is stable for two consecutive primes it is checked by trial division.
+    """
+
+    A, B = primitive_part(a), primitive_part(b)
+    if len(A) < len(B):
+        A, B = B, A
+
+    degree = len(B) - 1
+    residues: list[int] = []
+    modulus = 1
+    candidate: list[Fraction] | None = None
+
+    for p in iter_primes():
+        if A[-1] % p == 0 or B[-1] % p == 0:
+            continue
+        g = gcd_mod_p(A, B, p)
+        if len(g) - 1 > degree:
+            continue
+        if len(g) == 1:
+            return [1]
+        if len(g) - 1 < degree:
+            degree = len(g) - 1
+            residues, modulus, candidate = g, p, None
+            continue
+
+        if modulus == 1:
+            residues, modulus = g, p
+        else:
+            residues = [crt(r, modulus, c, p) for r, c in zip(residues, g)]
+            modulus *= p
+
+        reconstructed = [rational_reconstruction(r, modulus) for r in residues]
+        if any(c is None for c in reconstructed):
+            candidate = None
+            continue
+        if reconstructed == candidate:
+            G = _normalize_sign(primitive_part(candidate))
+            if _divides(G, A) and _divides(G, B):
+                return G
+        candidate = reconstructed  # type: ignore[assignment]
+
+    raise ArithmeticError("Ran out of primes")  # pragma: no cover
+
+
+def _pseudo_remainder(a: list[int], b: list[int]) -> list[int]:
+    """lc(b)^(deg a - deg b + 1) a mod b over the integers."""
+
+    r = a.copy()
+    lc = b[-1]
+    db = len(b) - 1
+    for k in range(len(a) - 1, db - 1, -1):
+        factor = r[k]
+        r = [lc * c for c in r]
+        shift = k - db
+        for i, c in enumerate(b):
+            r[shift + i] -= factor * c
+        r.pop()
+    return _trim(r or [0])
+
+
+def gcd_subresultant(a: Sequence[Number], b: Sequence[Number]) -> list[int]:
+    """Gcd via the subresultant polynomial remainder sequence."""
+
+    A, B = primitive_part(a), primitive_part(b)
+    if len(A) < len(B):
+        A, B = B, A
+
+    g = h = 1
+    while B != [0]:
+        delta = len(A) - len(B)
+        R = _pseudo_remainder(A, B)
+        if R == [0]:
+            break
+        divisor = g * h**delta
+        A, B = B, [c // divisor for c in R]
+        g = A[-1]
+        h = g**delta // h ** (delta - 1) if delta else h
+        if len(B) == 1 and B != [0]:
+            return [1]
+    return _normalize_sign(primitive_part(B))
@@ -0,0 +1,154 @@
+"""Multiplication of coefficient lists (lowest power first)."""
+
+from __future__ import annotations
+
+import math
+from fractions import Fraction
+from typing import Sequence
+
+Number = int | Fraction
+
+# Below this length (of the shorter factor) the quadratic algorithms win.
+SCHOOLBOOK_THRESHOLD = 8
+KARATSUBA_THRESHOLD = 24
+# Kronecker substitution of Fraction coefficients is abandoned in favour of
+# Karatsuba when the common denominator is this many times longer (in bits)
+# than the largest single denominator.
+DENOMINATOR_GROWTH_LIMIT = 64
+
+
+def mul_schoolbook(a: Sequence[Number], b: Sequence[Number]) -> list[Number]:
+    """Quadratic product, works for any coefficient type."""
+
+    res: list[Number] = [0] * (len(a) + len(b) - 1)
+    for i, a_i in enumerate(a):
+        if a_i == 0:
+            continue
+        for j, b_j in enumerate(b):
+            res[i + j] += a_i * b_j
+    return res
+
+
+def _add_into(res: list[Number], values: Sequence[Number], shift: int) -> None:
+    for i, value in enumerate(values):
+        res[i + shift] += value
+
+
+def _zip_padded(a: Sequence[Number], b: Sequence[Number]):
+    if len(a) < len(b):
+        a, b = b, a
+    for i, value in enumerate(a):
+        yield value, b[i] if i < len(b) else 0
+
+
+def mul_karatsuba(a: Sequence[Number], b: Sequence[Number]) -> list[Number]:
+    """Karatsuba product, works for any coefficient type."""
+
+    if len(a) < len(b):
+        a, b = b, a
+    if len(b) <= KARATSUBA_THRESHOLD:
+        return mul_schoolbook(a, b)
+
+    m = len(a) // 2
+    res: list[Number] = [0] * (len(a) + len(b) - 1)
+    a0, a1 = a[:m], a[m:]
+
+    if len(b) <= m:
+        # Unbalanced factors: split only the longer one.
+        _add_into(res, mul_karatsuba(a0, b), 0)
+        _add_into(res, mul_karatsuba(a1, b), m)
+        return res
+
+    b0, b1 = b[:m], b[m:]
+    z0 = mul_karatsuba(a0, b0)
+    z2 = mul_karatsuba(a1, b1)
+    a01 = [x + y for x, y in _zip_padded(a0, a1)]
+    b01 = [x + y for x, y in _zip_padded(b0, b1)]
+    z1 = mul_karatsuba(a01, b01)
+    for i, value in enumerate(z0):
+        z1[i] -= value
+    for i, value in enumerate(z2):
+        z1[i] -= value
+
+    _add_into(res, z0, 0)
+    _add_into(res, z1[: len(res) - m], m)
+    _add_into(res, z2, 2 * m)
+    return res
+
+
+def _pack(coefficients: Sequence[int], n_bytes: int) -> int:
+    offset = 1 << (8 * n_bytes - 1)
+    packed = int.from_bytes(
+        b"".join((c + offset).to_bytes(n_bytes, "little") for c in coefficients),
+        "little",
+    )
+    return packed - _offsets(len(coefficients), n_bytes)
+
+
+def _unpack(value: int, length: int, n_bytes: int) -> list[int]:
+    offset = 1 << (8 * n_bytes - 1)
+    data = (value + _offsets(length, n_bytes)).to_bytes(length * n_bytes, "little")
+    return [
+        int.from_bytes(data[i : i + n_bytes], "little") - offset
+        for i in range(0, length * n_bytes, n_bytes)
+    ]
+
+
+def _offsets(length: int, n_bytes: int) -> int:
+    """Integer whose every n_bytes-wide digit is 2^(8 n_bytes - 1)."""
+
+    return int.from_bytes((bytes(n_bytes - 1) + b"\x80") * length, "little")
+
+
+def mul_kronecker(a: Sequence[int], b: Sequence[int]) -> list[int]:
+    """Product of integer lists via a single big integer multiplication.
+
+    Both lists are packed into integers with digits wide enough to hold any
+    coefficient of the result (in signed form), multiplied by CPython and
+    unpacked back.
+    """
+
+    length = len(a) + len(b) - 1
+    bound = max(map(abs, a)) * max(map(abs, b)) * min(len(a), len(b))
+    if bound == 0:
+        return [0] * length
+    n_bytes = (bound.bit_length() + 2 + 7) // 8
+    return _unpack(_pack(a, n_bytes) * _pack(b, n_bytes), length, n_bytes)
+
+
+def mul_integers(a: Sequence[int], b: Sequence[int]) -> list[int]:
+    if min(len(a), len(b)) < SCHOOLBOOK_THRESHOLD:
+        return mul_schoolbook(a, b)
+    return mul_kronecker(a, b)
+
+
+def multiply(a: Sequence[Number], b: Sequence[Number]) -> list[Number]:
+    """Product of coefficient lists, choosing the algorithm by size and type.
+
+    Integer coefficients go through Kronecker substitution, Fraction
+    coefficients are brought to a common denominator first. Karatsuba is
+    used when the common denominator would be too large.
+    """
+
+    if min(len(a), len(b)) < SCHOOLBOOK_THRESHOLD:
+        return mul_schoolbook(a, b)
+
+    a_denominators = [c.denominator for c in a if isinstance(c, Fraction)]
+    b_denominators = [c.denominator for c in b if isinstance(c, Fraction)]
+    if not a_denominators and not b_denominators:
+        return mul_kronecker(a, b)
+
+    a_denominator = math.lcm(*a_denominators)
+    b_denominator = math.lcm(*b_denominators)
+    max_bits = max(d.bit_length() for d in a_denominators + b_denominators)
+    if (
+        max(a_denominator.bit_length(), b_denominator.bit_length())
+        > DENOMINATOR_GROWTH_LIMIT * max_bits
+    ):
+        return mul_karatsuba(a, b)
+
+    product = mul_kronecker(
+        [int(c * a_denominator) for c in a], [int(c * b_denominator) for c in b]
+    )
+    denominator = a_denominator * b_denominator
+    return [Fraction(c, denominator) for c in product]
@@ -0,0 +1,103 @@
+"""Evaluation of a polynomial at many points."""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from itertools import pairwise
+from typing import Any, Sequence
+
+from functions.division import divmod_integer
+from functions.multiplication import Number, mul_integers
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def product_tree(leaves: list[list[int]]) -> list[list[list[int]]]:
+    """Subproduct tree of integer polynomials, leaves first, root last."""
+
+    tree = [leaves]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        tree.append(
+            [
+                mul_integers(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+                for i in range(0, len(level), 2)
+            ]
+        )
+    return tree
+
+
+def evaluate_remainder_tree(
+    integers: Sequence[int], points: Sequence[Number]
+) -> list[Fraction]:
+    """Values of an integer polynomial at the points via the subproduct tree.
+
+    The polynomial is reduced modulo the products of (b x - a), a/b being
+    the points, from the root of the tree down to the leaves, where the
+    remainders are the values. Without a fast division the remainders are
+    computed by long division, which makes this slower than a Horner
+    scheme per point on CPython.
+    """
+
+    leaves = [[-Fraction(p).numerator, Fraction(p).denominator] for p in points]
+    remainders: list[tuple[list[int], int]] = [(list(integers), 1)]
+    for level in reversed(product_tree(leaves)):
+        new_remainders = []
+        for i, node in enumerate(level):
+            remainder, d = remainders[i // 2]
+            if len(remainder) >= len(node):
+                _, remainder, scale = divmod_integer(remainder, node)
+                d *= scale
+            new_remainders.append((remainder, d))
+        remainders = new_remainders
+    return [Fraction(remainder[0], d) for remainder, d in remainders]
+
+
+def continue_progression(
+    values: Sequence[Any], degree: int, count: int
+) -> list[Any]:
+    """Continue the values of a polynomial of given degree at equally spaced
+    points to count values, by summing its forward differences."""
+
+    values = list(values[: degree + 1])
+    if count <= len(values):
+        return values[:count]
+    rows = [values]
+    for _ in range(degree):
+        rows.append([b - a for a, b in pairwise(rows[-1])])
+    diagonal = [row[-1] for row in rows]
+
+    for _ in range(count - len(values)):
+        for k in range(degree - 1, -1, -1):
+            diagonal[k] += diagonal[k + 1]
+        values.append(diagonal[0])
+    return values[:count]
+
+
+def evaluate_numpy(coefficients: Sequence[Number], points: Any) -> Any:
+    """Vectorised Horner scheme for float or int64 arrays of points."""
+
+    if np.issubdtype(points.dtype, np.integer):
+        coeffs = [int(c) for c in coefficients]
+        dtype = np.int64
+    else:
+        coeffs = [float(c) for c in coefficients]
+        dtype = np.float64
+    res = np.zeros(points.shape, dtype=dtype)
+    for c in reversed(coeffs):
+        res *= points
+        res += c
+    return res
+
+
+def fits_int64(integers: Sequence[int], max_abs_point: int) -> bool:
+    """Whether a Horner evaluation of integer coefficients stays in int64."""
+
+    bound, power = 0, 1
+    for c in integers:
+        bound += abs(c) * power
+        power *= max_abs_point
+    return bound < 2**63
@@ -0,0 +1,106 @@
+"""Polynomials in the Newton forward difference basis."""
+
+from __future__ import annotations
+
+import math
+from fractions import Fraction
+from typing import Iterable, Sequence
+
+from functions.multiplication import mul_integers
+from functions.multipoint import product_tree
+from functions.polynomial import Number, Polynomial
+
+
+def newton_to_monomial(integers: Sequence[int]) -> list[int]:
+    """Monomial coefficients of sum c_i x (x - 1) ... (x - i + 1).
+
+    Divide and conquer over the subproduct tree of the factors x - t: the
+    coefficients c_lo, ..., c_hi are split in halves, the high half is
+    converted on its own and multiplied by the product of the factors
+    spanned by the low half.
+    """
+
+    n = len(integers)
+    if n <= 1:
+        return list(integers) or [0]
+    tree = product_tree([[-t, 1] for t in range(n)])
+
+    def convert(start: int, level: int) -> list[int]:
+        if level == 0:
+            return [integers[start]]
+        half = 1 << (level - 1)
+        low = convert(start, level - 1)
+        if start + half >= n:
+            return low
+        high = mul_integers(
+            convert(start + half, level - 1), tree[level - 1][start // half]
+        )
+        for i, c in enumerate(low):
+            high[i] += c
+        return high
+
+    return convert(0, len(tree) - 1)
+
+
+class NewtonPolynomial:
+    """Polynomial sum d_i binomial(x, i), d_i being the forward differences
+    of its values at 0, 1, 2, ...
+
+    At integer points the binomials are built one from another with exact
+    integer division, so no Fractions appear for integer differences.
+    """
+
+    __slots__ = ("differences",)
+
+    def __init__(self, differences: Iterable[Number]) -> None:
+        self.differences = list(differences)
+        while len(self.differences) > 1 and self.differences[-1] == 0:
+            self.differences.pop()
+
+    def __repr__(self) -> str:
+        return f"NewtonPolynomial({self.differences!r})"
+
+    def __str__(self) -> str:
+        return str(self.to_polynomial())
+
+    @property
+    def degree(self) -> int:
+        return len(self.differences) - 1 if any(self.differences) else 0
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, NewtonPolynomial):
+            return self.differences == other.differences
+        return NotImplemented
+
+    def __call__(self, x: Number) -> Number:
+        integer = isinstance(x, int)
+        if not integer and not isinstance(x, float):
+            x = Fraction(x)
+        res: Number = 0
+        binomial: Number = 1
+        for i, difference in enumerate(self.differences):
+            res += difference * binomial
+            if integer:
+                binomial = binomial * (x - i) // (i + 1)
+            else:
+                binomial = binomial * (x - i) / (i + 1)
+            if not binomial:
+                break
+        return res
+
+    def evaluate_many(self, points: Iterable[Number]) -> list[Number]:
+        return [self(x) for x in points]
+
+    def to_polynomial(self) -> Polynomial:
+        """Monomial form, the coefficients d_i / i! are brought to a common
+        denominator and converted by newton_to_monomial."""
+
+        coefficients = [
+            Fraction(difference) / math.factorial(i)
+            for i, difference in enumerate(self.differences)
+        ]
+        factor = math.lcm(*[c.denominator for c in coefficients])
+        integers = newton_to_monomial(
+            [c.numerator * (factor // c.denominator) for c in coefficients]
+        )
+        return Polynomial._from_integers(Fraction(1, factor), integers)._truncate()
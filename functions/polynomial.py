@@ -3,24 +3,104 @@ from __future__ import annotations
 import itertools
 import math
 import re
+from array import array
 from fractions import Fraction
-
-from iter_helpers import iter_2partitions
+from typing import Any, Iterable, Sequence, cast
+
+from functions.composition import compose_integers, taylor_shift
+from functions.division import divmod_integer
+from functions.gcd import gcd_modular, gcd_subresultant
+from functions.multiplication import mul_integers
+from functions.multipoint import (
+    continue_progression,
+    evaluate_numpy,
+    evaluate_remainder_tree,
+    fits_int64,
+    np,
+)
 from number import stirlingI
 
 Number = int | Fraction
 
+# Below this degree the subresultant gcd has the smaller overhead.
+MODULAR_GCD_THRESHOLD = 32
+
 
 class Polynomial:
-    """Class for a polynomial with rational coefficients."""
+    """Class for a polynomial with rational coefficients.
+
+    Coefficients are stored as a rational content times a list of coprime
+    integers, arithmetic works on the integers. The list of rational
+    coefficients is only built when it is asked for and must not be
+    modified in place; use the *_inplace methods to build a polynomial
+    step by step.
+    """
+
+    __slots__ = ("_coefficients", "_content", "_integers")
 
     def __init__(self, *coefficients: Number) -> None:
-        self.coefficients: list[Number] = [
+        self._coefficients: list[Number] | None = [
             coefficient if isinstance(coefficient, int) else Fraction(coefficient)
             for coefficient in coefficients
         ]
-        if not self.coefficients:
-            self.coefficients.append(0)
+        if not self._coefficients:
+            self._coefficients.append(0)
+        self._content: Fraction | None = None
+        self._integers: Sequence[int] | None = None
+
+    @classmethod
+    def _from_integers(
+        cls, content: Fraction, integers: Sequence[int]
+    ) -> Polynomial:
+        """Polynomial content * integers, the integers are made coprime."""
+
+        gcd = math.gcd(*integers)
+        if gcd == 0 or content == 0:
+            content, integers = Fraction(1), [0] * len(integers)
+        elif gcd > 1:
+            content *= gcd
+            integers = [c // gcd for c in integers]
+
+        res = cls.__new__(cls)
+        res._coefficients = None
+        res._content = Fraction(content)
+        res._integers = integers
+        return res
+
+    @property
+    def coefficients(self) -> list[Number]:
+        if self._coefficients is None:
+            content, integers = self.primitive()
+            if content.denominator == 1:
+                factor = content.numerator
+                self._coefficients = [factor * c for c in integers]
+            else:
+                self._coefficients = [content * c for c in integers]
+        return self._coefficients
+
+    def primitive(self) -> tuple[Fraction, Sequence[int]]:
+        """Content and primitive part: self = content * integers, with
+        coprime integers. The returned list must not be modified."""
+
+        if self._integers is None:
+            coefficients = cast(list[Number], self._coefficients)
+            factor = math.lcm(
+                *[c.denominator for c in coefficients if isinstance(c, Fraction)]
+            )
+            integers = [
+                (
+                    c * factor
+                    if isinstance(c, int)
+                    else c.numerator * (factor // c.denominator)
+                )
+                for c in coefficients
+            ]
+            gcd = math.gcd(*integers) or 1
+            if gcd > 1:
+                integers = [c // gcd for c in integers]
+            self._content = Fraction(gcd, factor)
+            self._integers = integers
+        return cast(Fraction, self._content), self._integers
 
     def __repr__(self) -> str:
         return "Polynomial(" + ",".join(str(coeff) for coeff in self.coefficients) + ")"
@@ -48,59 +128,138 @@ class Polynomial:
 
     @property
     def degree(self) -> int:
-        return len(self.coefficients) - 1
+        if self._coefficients is None:
+            return len(cast(Sequence[int], self._integers)) - 1
+        return len(self._coefficients) - 1
 
     def _truncate(self) -> Polynomial:
         """Remove leading zeros"""
 
-        while len(self.coefficients) > 1 and self.coefficients[-1] == 0:
-            self.coefficients.pop()
+        if self._coefficients is not None:
+            while len(self._coefficients) > 1 and self._coefficients[-1] == 0:
+                self._coefficients.pop()
+
+        if self._integers is not None:
+            n = len(self._integers)
+            while n > 1 and self._integers[n - 1] == 0:
+                n -= 1
+            if n < len(self._integers):
+                self._integers = self._integers[:n]
 
         return self
 
     def __call__(self, x: Number) -> Number:
         """Evaluate polynomial at a given point"""
 
-        res = 0
-        for coefficient in reversed(self.coefficients):
-            res = coefficient + x * res
-        return res
+        if isinstance(x, Polynomial):
+            return self.compose(x)
+        if not isinstance(x, Number):
+            res = 0
+            for coefficient in reversed(self.coefficients):
+                res = coefficient + x * res
+            return res
+
+        content, integers = self.primitive()
+        p, q = x.numerator, x.denominator
+        if q == 1:
+            value = 0
+            for c in reversed(integers):
+                value = value * p + c
+            res = content * value
+            return res.numerator if res.denominator == 1 else res
+
+        # homogeneous Horner scheme: sum c_k p^k q^(n-k)
+        value, q_power = 0, 1
+        for c in reversed(integers):
+            value = value * p + c * q_power
+            q_power *= q
+        return content * Fraction(value * q, q_power)
+
+    def evaluate_many(self, points: Iterable[Any], method: str = "horner") -> Any:
+        """Evaluate polynomial at many points.
+
+        NumPy arrays of floats, and of integers if int64 cannot overflow, go
+        through a vectorised Horner scheme and give an array. Other points
+        are evaluated exactly, one by one ("horner") or by a subproduct tree
+        ("tree").
+        """
+
+        if np is not None and isinstance(points, np.ndarray):
+            if points.dtype.kind == "f":
+                return evaluate_numpy(self.coefficients, points)
+            if points.dtype.kind in "iu" and points.size:
+                content, integers = self.primitive()
+                max_abs = max(abs(int(points.max())), abs(int(points.min())))
+                if content.denominator == 1 and fits_int64(
+                    [content.numerator * c for c in integers], max_abs
+                ):
+                    return evaluate_numpy(self.coefficients, points.astype(np.int64))
+            return np.array(
+                self.evaluate_many(points.tolist(), method), dtype=object
+            )
+
+        points = list(points)
+        if method == "horner":
+            return [self(x) for x in points]
+        if method == "tree":
+            content, integers = self.primitive()
+            values = [content * v for v in evaluate_remainder_tree(integers, points)]
+            return [v.numerator if v.denominator == 1 else v for v in values]
+        raise ValueError(f"Unknown evaluation method {method}")
+
+    def evaluate_progression(
+        self, start: Number, step: Number, count: int
+    ) -> list[Number]:
+        """Values at start, start + step, ..., start + (count - 1) * step.
+
+        Only the first degree + 1 values are evaluated, the rest are summed
+        up from their forward differences.
+        """
+
+        first = [self(start + k * step) for k in range(min(count, self.degree + 1))]
+        return continue_progression(first, self.degree, count)
 
     def __add__(self, other: Polynomial | Number) -> Polynomial:
         if isinstance(other, Number):
             other = Polynomial(other)
         if isinstance(other, Polynomial):
-            res = Polynomial(
-                *[
-                    coef1 + coef2
-                    for coef1, coef2 in itertools.zip_longest(
-                        self.coefficients, other.coefficients, fillvalue=0
-                    )
-                ]
-            )
-            res._truncate()
-            return res
+            return self._add(other, 1)
         return NotImplemented
 
     __radd__ = __add__
 
+    def _add(self, other: Polynomial, sign: int) -> Polynomial:
+        """self + sign * other on the integer parts."""
+
+        content1, integers1 = self.primitive()
+        content2, integers2 = other.primitive()
+        content = Fraction(
+            math.gcd(content1.numerator, content2.numerator),
+            math.lcm(content1.denominator, content2.denominator),
+        )
+        factor1 = (content1 / content).numerator
+        factor2 = sign * (content2 / content).numerator
+        res = Polynomial._from_integers(
+            content,
+            [
+                factor1 * coef1 + factor2 * coef2
+                for coef1, coef2 in itertools.zip_longest(
+                    integers1, integers2, fillvalue=0
+                )
+            ],
+        )
+        res._truncate()
+        return res
+
     def __neg__(self) -> Polynomial:
-        return Polynomial(*[-coeff for coeff in self.coefficients])
+        content, integers = self.primitive()
+        return Polynomial._from_integers(-content, integers)
 
     def __sub__(self, other: Polynomial | Number) -> Polynomial:
         if isinstance(other, Number):
             other = Polynomial(other)
         if isinstance(other, Polynomial):
-            res = Polynomial(
-                *[
-                    coef1 - coef2
-                    for coef1, coef2 in itertools.zip_longest(
-                        self.coefficients, other.coefficients, fillvalue=0
-                    )
-                ]
-            )
-            res._truncate()
-            return res
+            return self._add(other, -1)
         return NotImplemented
 
     def __rsub__(self, other: Polynomial | Number) -> Polynomial:
@@ -110,46 +269,38 @@ class Polynomial:
         if other == 0:
             return Polynomial()
         if isinstance(other, Number):
-            return Polynomial(*[other * coeff for coeff in self.coefficients])
+            content, integers = self.primitive()
+            return Polynomial._from_integers(content * other, integers)
         if isinstance(other, Polynomial):
-            bounds = (self.degree, other.degree)
-            return Polynomial(
-                *[
-                    sum(
-                        self[i] * other[j]
-                        for i, j in iter_2partitions(n, bounds=bounds)
-                    )
-                    for n in range(self.degree + other.degree + 1)
-                ]
+            content1, integers1 = self.primitive()
+            content2, integers2 = other.primitive()
+            return Polynomial._from_integers(
+                content1 * content2, mul_integers(integers1, integers2)
             )
         return NotImplemented
 
     __rmul__ = __mul__
 
     def __pow__(self, power: int) -> Polynomial:
-        n = self.degree
-
-        P = [self.coefficients[0] ** power]
-
-        for k in range(1, power * n + 1):
-            P.append(
-                sum(
-                    (power * (k - i) - i) * self.coefficients[k - i] * P[i]
-                    for i in range(max(0, k - n), k)
-                )
-                / (k * self.coefficients[0])
-            )
+        if power < 0:
+            raise ValueError(power)
 
-        if all(isinstance(coeff, int) for coeff in self.coefficients):
-            P = [int(p) for p in P]
+        content, base = self.primitive()
+        res = [1]
+        n = power
+        while n:
+            if n & 1:
+                res = mul_integers(res, base)
+            n >>= 1
+            if n:
+                base = mul_integers(base, base)
 
-        return Polynomial(*P)
+        return Polynomial._from_integers(content**power, res)
 
     def __truediv__(self, other: Number) -> Polynomial:
         if isinstance(other, Number):
-            return Polynomial(
-                *[Fraction(coefficient, other) for coefficient in self.coefficients]
-            )
+            content, integers = self.primitive()
+            return Polynomial._from_integers(content / other, integers)
         return NotImplemented
 
     def __floordiv__(self, other: Polynomial) -> Polynomial:
@@ -165,20 +316,23 @@ class Polynomial:
         return Q
 
     def __divmod__(self, other: Polynomial) -> tuple[Polynomial, Polynomial]:
-        dividend = self.coefficients.copy()
-        quotient_degree = self.degree - other.degree
+        content1, dividend = self.primitive()
+        content2, divisor = other.primitive()
+        if not any(divisor):
+            raise ZeroDivisionError
+        while divisor[-1] == 0:
+            divisor = divisor[:-1]
+
+        quotient_degree = len(dividend) - len(divisor)
         if quotient_degree < 0:
             return Polynomial(), self
 
-        quotient: list[Number] = [0] * (quotient_degree + 1)
-        for k in range(quotient_degree + 1):
-            d = Fraction(dividend[-k - 1], other.coefficients[-1])
-            for i, c in enumerate(other.coefficients):
-                dividend[quotient_degree - k + i] -= c * d
-            quotient[-k - 1] = d
+        # division by Newton inversion of the reversed divisor loses at every
+        # size: the inverse has far larger coefficients than the quotient
+        quotient, remainder, d = divmod_integer(dividend, divisor)
 
-        Q = Polynomial(*quotient)
-        D = Polynomial(*dividend)
+        Q = Polynomial._from_integers(content1 / (content2 * d), quotient)
+        D = Polynomial._from_integers(content1 / d, remainder)
         D._truncate()
         return Q, D
 
@@ -191,39 +345,136 @@ class Polynomial:
         if self.degree != other.degree:
             return False
 
-        return all(
-            coef1 == coef2
-            for coef1, coef2 in zip(self.coefficients, other.coefficients)
+        if self._coefficients is not None and other._coefficients is not None:
+            return all(
+                coef1 == coef2
+                for coef1, coef2 in zip(self._coefficients, other._coefficients)
+            )
+
+        # primitive parts are unique up to sign
+        content1, integers1 = self.primitive()
+        content2, integers2 = other.primitive()
+        if all(coef1 == coef2 for coef1, coef2 in zip(integers1, integers2)):
+            return content1 == content2 or not any(integers1)
+        return content1 == -content2 and all(
+            coef1 == -coef2 for coef1, coef2 in zip(integers1, integers2)
         )
 
     def copy(self) -> Polynomial:
-        return Polynomial(*self.coefficients.copy())
+        """Mutable copy, also of a FrozenPolynomial."""
+
+        res = Polynomial.__new__(Polynomial)
+        res._coefficients = (
+            list(self._coefficients) if self._coefficients is not None else None
+        )
+        res._content = self._content
+        res._integers = (
+            list(self._integers) if self._integers is not None else None
+        )
+        return res
+
+    def freeze(self) -> FrozenPolynomial:
+        content, integers = self.primitive()
+        return FrozenPolynomial._from_integers(content, integers)
+
+    def _assign(self, other: Polynomial) -> Polynomial:
+        self._coefficients = (
+            list(other._coefficients) if other._coefficients is not None else None
+        )
+        self._content = other._content
+        self._integers = other._integers
+        return self
+
+    def add_inplace(self, other: Polynomial | Number) -> Polynomial:
+        """self += other, modifying this instance."""
+
+        return self._assign(self + other)
+
+    def sub_inplace(self, other: Polynomial | Number) -> Polynomial:
+        """self -= other, modifying this instance."""
+
+        return self._assign(self - other)
+
+    def mul_inplace(self, other: Polynomial | Number) -> Polynomial:
+        """self *= other, modifying this instance."""
+
+        return self._assign(self * other)
 
     def to_integer(self) -> Polynomial:
-        denominators = [
-            coeff.denominator
-            for coeff in self.coefficients
-            if isinstance(coeff, Fraction)
-        ]
-        factor = math.lcm(*denominators)
-        return Polynomial(*[int(factor * coeff) for coeff in self.coefficients])
+        content, integers = self.primitive()
+        return Polynomial._from_integers(Fraction(content.numerator), integers)
 
     def to_monic(self) -> Polynomial:
-        factor = Fraction(1, self.coefficients[-1])
-        return Polynomial(*[Fraction(coeff) * factor for coeff in self.coefficients])
+        _, integers = self.primitive()
+        return Polynomial._from_integers(Fraction(1, integers[-1]), integers)
 
-    def gcd(self, other: Polynomial) -> Polynomial:
-        a, b = self, other
-        while b != 0:
-            a, b = b, a % b
-        return a.to_monic()
+    def gcd(self, other: Polynomial, method: str | None = None) -> Polynomial:
+        """Monic greatest common divisor.
+
+        method is one of "euclid" (reference Euclidean algorithm over the
+        rationals), "subresultant" or "modular"; None picks by degree.
+        """
+
+        if method is None:
+            method = (
+                "modular"
+                if min(self.degree, other.degree) >= MODULAR_GCD_THRESHOLD
+                else "subresultant"
+            )
+
+        if other == 0 or self == 0 or method == "euclid":
+            a, b = self, other
+            while b != 0:
+                a, b = b, a % b
+            return a.to_monic()
+        if method == "modular":
+            gcd = gcd_modular(self.primitive()[1], other.primitive()[1])
+        elif method == "subresultant":
+            gcd = gcd_subresultant(self.primitive()[1], other.primitive()[1])
+        else:
+            raise ValueError(f"Unknown gcd method {method!r}")
+        return Polynomial._from_integers(Fraction(1, gcd[-1]), gcd)
 
     def get_coprimes_and_gcd(
         self, other: Polynomial
     ) -> tuple[Polynomial, Polynomial, Polynomial]:
         gcd = self.gcd(other)
+        if gcd.degree == 0:
+            return self, other, gcd
         return self // gcd, other // gcd, gcd
 
+    def shift(self, a: Number) -> Polynomial:
+        """Taylor shift: polynomial P(x + a)"""
+
+        content, integers = self.primitive()
+        a = Fraction(a)
+        p, q = a.numerator, a.denominator
+        n = len(integers) - 1
+        if q == 1:
+            return Polynomial._from_integers(content, taylor_shift(integers, p))
+
+        # q^n P(x / q) has integer coefficients, shift it by p and scale back
+        scaled = [c * q ** (n - k) for k, c in enumerate(integers)]
+        shifted = taylor_shift(scaled, p)
+        return Polynomial._from_integers(
+            content / q**n, [c * q**k for k, c in enumerate(shifted)]
+        )
+
+    def compose(self, other: Polynomial) -> Polynomial:
+        """Composition: polynomial P(Q(x))"""
+
+        content, integers = self.primitive()
+        other_content, other_integers = other.primitive()
+        r, s = other_content.numerator, other_content.denominator
+        n = len(integers) - 1
+        # P(r/s Q) = s^-n sum c_k r^k s^(n-k) Q^k
+        scaled = [c * r**k * s ** (n - k) for k, c in enumerate(integers)]
+        res = Polynomial._from_integers(
+            content / s**n, compose_integers(scaled, other_integers)
+        )
+        res._truncate()
+        return res
+
     def diff(self, order: int = 1) -> Polynomial:
         if order < 0:
             raise ValueError
@@ -278,3 +529,81 @@ class Polynomial:
         if power < 0:
             raise ValueError(power)
         return cls(*[abs(stirlingI(power, k)) for k in range(power + 1)])
+
+
+class FrozenPolynomial(Polynomial):
+    """Immutable and hashable polynomial, usable as a dict key.
+
+    Integer parts that fit into 64 bits are kept in an array('q'), others
+    in a tuple. Arithmetic returns ordinary Polynomial objects.
+    """
+
+    __slots__ = ("_degree", "_hash")
+
+    def __init__(self, *coefficients: Number) -> None:
+        super().__init__(*coefficients)
+        self._freeze()
+
+    @classmethod
+    def _from_integers(
+        cls, content: Fraction, integers: Sequence[int]
+    ) -> FrozenPolynomial:
+        res = cast(FrozenPolynomial, super()._from_integers(content, integers))
+        res._freeze()
+        return res
+
+    def _freeze(self) -> None:
+        _, integers = self.primitive()
+        try:
+            self._integers = array("q", integers)
+        except OverflowError:
+            self._integers = tuple(integers)
+        self._coefficients = None
+        self._degree = len(integers) - 1
+        self._hash: int | None = None
+
+    @property
+    def coefficients(self) -> tuple[Number, ...]:  # type: ignore[override]
+        if self._coefficients is None:
+            content, integers = self.primitive()
+            if content.denominator == 1:
+                factor = content.numerator
+                self._coefficients = tuple(factor * c for c in integers)
+            else:
+                self._coefficients = tuple(content * c for c in integers)
+        return self._coefficients
+
+    @property
+    def degree(self) -> int:
+        return self._degree
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            if self._degree == 0:
+                self._hash = hash(self.coefficients[0])
+            else:
+                content, integers = self.primitive()
+                # the sign is taken from the last non-zero coefficient, an
+                # untruncated value may end with zeros
+                lead = next((c for c in reversed(integers) if c), 0)
+                if not lead:
+                    content = Fraction(0)
+                elif lead < 0:
+                    content = -content
+                    integers = [-c for c in integers]
+                self._hash = hash((self._degree, content, tuple(integers)))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return "Frozen" + super().__repr__()
+
+    def _truncate(self) -> Polynomial:
+        if self._degree > 0 and self.primitive()[1][-1] == 0:
+            raise TypeError("FrozenPolynomial is immutable")
+        return self
+
+    def _assign(self, other: Polynomial) -> Polynomial:
+        raise TypeError("FrozenPolynomial is immutable")
+
+    def freeze(self) -> FrozenPolynomial:
+        return self
@@ -0,0 +1,239 @@
+"""Truncated power series with exact coefficients."""
+
+from __future__ import annotations
+
+from fractions import Fraction
+
+from functions.division import series_inverse
+from functions.multiplication import multiply
+from functions.polynomial import Number, Polynomial
+
+
+def _mul(a: list[Number], b: list[Number], n: int) -> list[Number]:
+    res = multiply(a[:n], b[:n])[:n]
+    res.extend([0] * (n - len(res)))
+    return res
+
+
+def _log(f: list[Number], n: int) -> list[Number]:
+    """log f = integral of f'/f, f[0] must be 1."""
+
+    if n == 1:
+        return [0]
+    df = [k * f[k] for k in range(1, n)]
+    quotient = _mul(df, series_inverse(f[: n - 1], n - 1), n - 1)
+    return [0] + [Fraction(c, k + 1) for k, c in enumerate(quotient)]
+
+
+def _exp(f: list[Number], n: int) -> list[Number]:
+    """Newton iteration g <- g (1 + f - log g), f[0] must be 0."""
+
+    g: list[Number] = [1]
+    precision = 1
+    while precision < n:
+        precision = min(2 * precision, n)
+        g.extend([0] * (precision - len(g)))
+        log_g = _log(g, precision)
+        h = [f[k] - log_g[k] for k in range(precision)]
+        h[0] += 1
+        g = _mul(g, h, precision)
+    return g
+
+
+def _integer_root(n: int, k: int) -> int:
+    """Floor of the k-th root of a non-negative integer."""
+
+    if n < 2:
+        return n
+    root = 1 << -(-n.bit_length() // k)
+    while True:
+        next_root = ((k - 1) * root + n // root ** (k - 1)) // k
+        if next_root >= root:
+            return root
+        root = next_root
+
+
+def _root(value: Fraction, k: int) -> Fraction:
+    """Exact k-th root of a rational number."""
+
+    if value < 0 and k % 2 == 0:
+        raise ValueError(f"{value} has no real root of order {k}")
+    numerator = _integer_root(abs(value.numerator), k)
+    denominator = _integer_root(value.denominator, k)
+    if numerator**k != abs(value.numerator) or denominator**k != value.denominator:
+        raise ValueError(f"Root of order {k} of {value} is irrational")
+    return Fraction(-numerator if value < 0 else numerator, denominator)
+
+
+class PowerSeries:
+    """Truncated power series c_0 + c_1 x + ... + O(x^precision).
+
+    Results of binary operations have the smaller precision of the
+    operands. inverse, log, exp, sqrt and powers use Newton iteration,
+    doubling the number of correct terms in each step.
+    """
+
+    __slots__ = ("coefficients", "precision")
+
+    def __init__(self, *coefficients: Number, precision: int) -> None:
+        if precision < 1:
+            raise ValueError("Precision must be positive")
+        self.precision = precision
+        self.coefficients: list[Number] = [
+            coefficient if isinstance(coefficient, int) else Fraction(coefficient)
+            for coefficient in coefficients[:precision]
+        ]
+        self.coefficients.extend([0] * (precision - len(self.coefficients)))
+
+    @classmethod
+    def _from_list(cls, coefficients: list[Number], precision: int) -> PowerSeries:
+        res = cls.__new__(cls)
+        res.precision = precision
+        res.coefficients = [
+            c.numerator if isinstance(c, Fraction) and c.denominator == 1 else c
+            for c in coefficients
+        ]
+        return res
+
+    @classmethod
+    def from_polynomial(cls, polynomial: Polynomial, precision: int) -> PowerSeries:
+        return cls(*polynomial.coefficients, precision=precision)
+
+    def to_polynomial(self) -> Polynomial:
+        return Polynomial(*self.coefficients)._truncate()
+
+    def __repr__(self) -> str:
+        return (
+            "PowerSeries("
+            + ",".join(str(coeff) for coeff in self.coefficients)
+            + f", precision={self.precision})"
+        )
+
+    def __str__(self) -> str:
+        return f"{self.to_polynomial()} + O(x^{self.precision})"
+
+    def __getitem__(self, key: int) -> Number:
+        return self.coefficients[key]
+
+    def __iter__(self):
+        return iter(self.coefficients)
+
+    def __len__(self) -> int:
+        return self.precision
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PowerSeries):
+            return (
+                self.precision == other.precision
+                and self.coefficients == other.coefficients
+            )
+        return NotImplemented
+
+    def _coerce(self, other: PowerSeries | Polynomial | Number) -> PowerSeries:
+        if isinstance(other, PowerSeries):
+            return other
+        if isinstance(other, Polynomial):
+            return PowerSeries.from_polynomial(other, self.precision)
+        return PowerSeries(other, precision=self.precision)
+
+    def __add__(self, other: PowerSeries | Polynomial | Number) -> PowerSeries:
+        other = self._coerce(other)
+        n = min(self.precision, other.precision)
+        return PowerSeries._from_list(
+            [a + b for a, b in zip(self.coefficients[:n], other.coefficients)], n
+        )
+
+    __radd__ = __add__
+
+    def __neg__(self) -> PowerSeries:
+        return PowerSeries._from_list([-c for c in self.coefficients], self.precision)
+
+    def __sub__(self, other: PowerSeries | Polynomial | Number) -> PowerSeries:
+        return self + (-self._coerce(other))
+
+    def __rsub__(self, other: PowerSeries | Polynomial | Number) -> PowerSeries:
+        return -self + other
+
+    def __mul__(self, other: PowerSeries | Polynomial | Number) -> PowerSeries:
+        if isinstance(other, Number):
+            return PowerSeries._from_list(
+                [other * c for c in self.coefficients], self.precision
+            )
+        other = self._coerce(other)
+        n = min(self.precision, other.precision)
+        return PowerSeries._from_list(
+            _mul(self.coefficients, other.coefficients, n), n
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: PowerSeries | Polynomial | Number) -> PowerSeries:
+        if isinstance(other, Number):
+            return self * Fraction(1, other)
+        return self * self._coerce(other).inverse()
+
+    def __rtruediv__(self, other: Polynomial | Number) -> PowerSeries:
+        return self._coerce(other) * self.inverse()
+
+    def __pow__(self, power: int | Fraction) -> PowerSeries:
+        """Integer powers by squaring, other powers as exp(power log(self))."""
+
+        power = Fraction(power)
+        if power.denominator == 1 and power >= 0:
+            res = PowerSeries(1, precision=self.precision)
+            square, exponent = self, power.numerator
+            while exponent:
+                if exponent & 1:
+                    res *= square
+                exponent >>= 1
+                if exponent:
+                    square *= square
+            return res
+        if power.denominator == 1:
+            return self.inverse() ** -power
+
+        constant = Fraction(self.coefficients[0])
+        if constant == 0:
+            raise ValueError("Constant term of the series is zero")
+        factor = _root(constant, power.denominator) ** power.numerator
+        return (power * (self / constant).log()).exp() * factor
+
+    def inverse(self) -> PowerSeries:
+        """Multiplicative inverse, the constant term must be non-zero."""
+
+        return PowerSeries._from_list(
+            series_inverse(self.coefficients, self.precision), self.precision
+        )
+
+    def log(self) -> PowerSeries:
+        """Logarithm, the constant term must be 1."""
+
+        if self.coefficients[0] != 1:
+            raise ValueError("Constant term of the series must be 1")
+        return PowerSeries._from_list(
+            _log(self.coefficients, self.precision), self.precision
+        )
+
+    def exp(self) -> PowerSeries:
+        """Exponent, the constant term must be 0."""
+
+        if self.coefficients[0] != 0:
+            raise ValueError("Constant term of the series must be 0")
+        return PowerSeries._from_list(
+            _exp(self.coefficients, self.precision), self.precision
+        )
+
+    def sqrt(self) -> PowerSeries:
+        """Square root with positive constant term, by the Newton iteration
+        g <- (g + self / g) / 2."""
+
+        g: list[Number] = [_root(Fraction(self.coefficients[0]), 2)]
+        if g[0] == 0:
+            raise ValueError("Constant term of the series is zero")
+        precision = 1
+        while precision < self.precision:
+            precision = min(2 * precision, self.precision)
+            g.extend([0] * (precision - len(g)))
+            quotient = _mul(self.coefficients, series_inverse(g, precision), precision)
+            g = [Fraction(a + b) / 2 for a, b in zip(g, quotient)]
+        return PowerSeries._from_list(g, self.precision)
@@ -2,14 +2,45 @@ from __future__ import annotations
 
 import itertools
 import math
+from contextlib import contextmanager
+from contextvars import ContextVar
 from fractions import Fraction
+from typing import Iterator
 
 from functions.polynomial import Number, Polynomial
 
+# (max_degree, max_bits) inside Rational.lazy_cancellation, None outside
+_lazy_limits: ContextVar[tuple[int, int] | None] = ContextVar(
+    "lazy_limits", default=None
+)
+LAZY_MAX_DEGREE = 16
+LAZY_MAX_BITS = 256
+
+
+def _bit_size(polynomial: Polynomial) -> int:
+    content, integers = polynomial.primitive()
+    return (
+        max(abs(coeff) for coeff in integers).bit_length()
+        + content.numerator.bit_length()
+        + content.denominator.bit_length()
+    )
+
+
+def _numerators_gcd(polynomial: Polynomial) -> int:
+    """Gcd of the numerators of the coefficients in lowest terms."""
+
+    content, integers = polynomial.primitive()
+    denominator = content.denominator
+    return abs(content.numerator) * math.gcd(
+        *[coeff // math.gcd(coeff, denominator) for coeff in integers]
+    )
+
 
 class Rational:
     """Rational function with rational coefficients."""
 
+    __slots__ = ("numerator", "denominator", "_cancelled")
+
     def __init__(
         self,
         numerator: Polynomial | Number,
@@ -30,24 +61,87 @@ class Rational:
             else Polynomial(1)
         )
 
-        if not cancel:
-            return
+        self._cancelled = False
+        if cancel:
+            self._cancel()
+
+    @classmethod
+    @contextmanager
+    def lazy_cancellation(
+        cls, max_degree: int | None = None, max_bits: int | None = None
+    ) -> Iterator[None]:
+        """Keep arithmetic results unreduced inside the context.
+
+        A result is still cancelled once its total degree exceeds max_degree
+        or one of its coefficients needs more than max_bits bits. Limits
+        not given are taken from an enclosing context. The mode is kept in
+        a context variable, so other threads and tasks are not affected.
+        """
+
+        outer = _lazy_limits.get() or (LAZY_MAX_DEGREE, LAZY_MAX_BITS)
+        token = _lazy_limits.set(
+            (
+                outer[0] if max_degree is None else max_degree,
+                outer[1] if max_bits is None else max_bits,
+            )
+        )
+        try:
+            yield
+        finally:
+            _lazy_limits.reset(token)
+
+    @staticmethod
+    def is_lazy() -> bool:
+        """Whether arithmetic runs inside lazy_cancellation."""
+        return _lazy_limits.get() is not None
+
+    @classmethod
+    def _from_arithmetic(
+        cls, numerator: Polynomial, denominator: Polynomial
+    ) -> Rational:
+        """Result of an arithmetic operation, cancelled unless in lazy mode."""
+
+        limits = _lazy_limits.get()
+        if limits is None:
+            return cls(numerator, denominator)
+        max_degree, max_bits = limits
+        res = cls(numerator, denominator, cancel=False)
+        if (
+            res.numerator.degree + res.denominator.degree > max_degree
+            or max(_bit_size(res.numerator), _bit_size(res.denominator)) > max_bits
+        ):
+            res._cancel()
+        return res
 
-        if self.numerator.degree > 0 and self.denominator.degree > 0:
+    def normalize(self) -> Rational:
+        """Cancel common factors in place if it has not been done yet."""
+
+        if not self._cancelled:
+            self._cancel()
+        return self
+
+    @classmethod
+    def from_coprime(cls, numerator: Polynomial, denominator: Polynomial) -> Rational:
+        """Rational from polynomials known to have no common factor: only the
+        scalar normalization of cancellation is done, no gcd is computed."""
+
+        res = cls(numerator, denominator, cancel=False)
+        res._cancel(coprime=True)
+        return res
+
+    def _cancel(self, coprime: bool = False) -> None:
+        self._cancelled = True
+        if not coprime and self.numerator.degree > 0 and self.denominator.degree > 0:
             self.numerator, self.denominator, _ = self.numerator.get_coprimes_and_gcd(
                 self.denominator
             )
         if self.denominator.degree == 0:
-            factor = Fraction(1, self.denominator[0])
-            self.numerator = Polynomial(*[factor * coeff for coeff in self.numerator])
+            self.numerator = self.numerator / self.denominator[0]
             self.denominator = Polynomial(1)
         gcd = math.gcd(
-            *[
-                coeff.numerator if isinstance(coeff, Fraction) else coeff
-                for coeff in itertools.chain(self.numerator, self.denominator)
-            ]
+            _numerators_gcd(self.numerator), _numerators_gcd(self.denominator)
         )
-        if gcd != 1:
+        if gcd not in (0, 1):
             self.numerator /= gcd
             self.denominator /= gcd
 
@@ -82,7 +176,7 @@ class Rational:
         if isinstance(other, Number | Polynomial):
             other = Rational(other)
         if isinstance(other, Rational):
-            return Rational(
+            return Rational._from_arithmetic(
                 self.numerator * other.numerator, self.denominator * other.denominator
             )
         return NotImplemented
@@ -93,9 +187,9 @@ class Rational:
         if other == 0:
             raise ZeroDivisionError
         if isinstance(other, Number | Polynomial):
-            return Rational(self.numerator, self.denominator * other)
+            return Rational._from_arithmetic(self.numerator, self.denominator * other)
         if isinstance(other, Rational):
-            return Rational(
+            return Rational._from_arithmetic(
                 self.numerator * other.denominator, self.denominator * other.numerator
             )
         return NotImplemented
@@ -108,7 +202,15 @@ class Rational:
             other = Rational(other)
         if isinstance(other, Rational):
             if self.denominator == other.denominator:
-                return Rational(self.numerator + other.numerator, self.denominator)
+                return Rational._from_arithmetic(
+                    self.numerator + other.numerator, self.denominator
+                )
+            if Rational.is_lazy():
+                return Rational._from_arithmetic(
+                    self.numerator * other.denominator
+                    + other.numerator * self.denominator,
+                    self.denominator * other.denominator,
+                )
             Q1, Q2, gcd = self.denominator.get_coprimes_and_gcd(other.denominator)
             return Rational(self.numerator * Q2 + other.numerator * Q1, Q1 * Q2 * gcd)
         return NotImplemented
@@ -116,14 +218,24 @@ class Rational:
     __radd__ = __add__
 
     def __neg__(self) -> Rational:
-        return Rational(-self.numerator, self.denominator, cancel=False)
+        res = Rational(-self.numerator, self.denominator, cancel=False)
+        res._cancelled = self._cancelled
+        return res
 
     def __sub__(self, other: Rational | Polynomial | Number) -> Rational:
         if isinstance(other, Number | Polynomial):
             other = Rational(other)
         if isinstance(other, Rational):
             if self.denominator == other.denominator:
-                return Rational(self.numerator - other.numerator, self.denominator)
+                return Rational._from_arithmetic(
+                    self.numerator - other.numerator, self.denominator
+                )
+            if Rational.is_lazy():
+                return Rational._from_arithmetic(
+                    self.numerator * other.denominator
+                    - other.numerator * self.denominator,
+                    self.denominator * other.denominator,
+                )
             Q1, Q2, gcd = self.denominator.get_coprimes_and_gcd(other.denominator)
             return Rational(self.numerator * Q2 - other.numerator * Q1, Q1 * Q2 * gcd)
         return NotImplemented
@@ -132,14 +244,23 @@ class Rational:
         return (-1) * self + other
 
     def __pow__(self, order: int) -> Rational:
-        return Rational(self.numerator**order, self.denominator**order)
+        return Rational._from_arithmetic(
+            self.numerator**order, self.denominator**order
+        )
 
     def __eq__(self, other: Rational | Polynomial | Number) -> bool:
         if isinstance(other, Rational):
+            if not (self._cancelled and other._cancelled):
+                return (
+                    self.numerator * other.denominator
+                    == other.numerator * self.denominator
+                )
             return (
                 self.numerator == other.numerator
                 and self.denominator == other.denominator
             )
+        if not self._cancelled and isinstance(other, Number | Polynomial):
+            return self.numerator == self.denominator * other
         if self.denominator == 1:
             return self.numerator == other
         return False
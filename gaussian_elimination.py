@@ -1,19 +1,59 @@
-import copy
 import itertools
+import math
 from fractions import Fraction
-from typing import Optional, TypeVar, Union
+from typing import Any, Optional, TypeVar, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
 
 T = TypeVar("T", int, float, Fraction)
 
+# Float matrices with fewer rows are faster without NumPy.
+NUMPY_THRESHOLD = 20
+
 
 def augment(A: list[list[T]], B: list[list[T]]) -> list[list[T]]:
     return [list(itertools.chain(a_row, b_row)) for a_row, b_row in zip(A, B)]
 
 
 def gaussian_elimination(
-    M: list[list[T]], jordan: bool = False
+    M: list[list[T]],
+    jordan: bool = False,
+    fraction_free: bool = False,
+    inplace: bool = False,
 ) -> list[list[T]]:
-    A = copy.deepcopy(M)
+    """Row echelon form of M, reduced row echelon form if jordan.
+
+    With fraction_free the rows are scaled to integers and eliminated by
+    bareiss with the same pivots, the rows are divided only at the end and
+    the result is the same matrix with exact Fractions. Large float
+    matrices are eliminated by NumPy when it is available. With inplace
+    the rows of M are overwritten and M is returned, otherwise M is left
+    untouched.
+    """
+
+    if fraction_free:
+        integers, factors = clear_denominators(M)
+        A, _, order = _bareiss(integers, jordan, factors)
+        # a Bareiss row is the row of the division path times the previous
+        # pivot and the factor that cleared its denominators
+        previous = 1
+        for row, i in zip(A, order):
+            lead = next((a for a in row if a != 0), None)
+            divisor = lead if jordan else previous * factors[i]
+            if lead is not None:
+                row[:] = [Fraction(a, divisor) for a in row]
+                previous = lead
+        return _write_back(M, A) if inplace else A
+
+    if np is not None and len(M) >= NUMPY_THRESHOLD and _is_float_matrix(M):
+        A = _gaussian_elimination_numpy(M, jordan)
+        return _write_back(M, A) if inplace else A
+
+    # entries are immutable numbers, copying the rows is enough
+    A = M if inplace else [list(row) for row in M]
     n_rows = len(A)
     n_cols = len(A[0])
 
@@ -34,7 +74,7 @@ def gaussian_elimination(
         a_max = A[i][j]
         i_max = i
         for k in range(i, len(A)):
-            if A[k][j] > a_max:
+            if abs(A[k][j]) > abs(a_max):
                 a_max = A[k][j]
                 i_max = k
         return a_max, i_max
@@ -78,3 +118,227 @@ def gaussian_elimination(
         pivot_row -= 1
 
     return A
+
+
+def _write_back(M: list[list[T]], A: list[list[T]]) -> list[list[T]]:
+    for row, new_row in zip(M, A):
+        row[:] = new_row
+    return M
+
+
+def _is_float_matrix(M: list[list[Any]]) -> bool:
+    has_float = False
+    for row in M:
+        for a in row:
+            if isinstance(a, float):
+                has_float = True
+            elif not isinstance(a, int):
+                return False
+    return has_float
+
+
+def _gaussian_elimination_numpy(
+    M: list[list[float]], jordan: bool
+) -> list[list[float]]:
+    """Same elimination with whole row operations on a NumPy array."""
+
+    A = np.array(M, dtype=float)
+    n_rows, n_cols = A.shape
+
+    pivot_row = 0
+    pivot_col = 0
+
+    while pivot_row < n_rows and pivot_col < n_cols:
+        i_max = pivot_row + int(np.argmax(np.abs(A[pivot_row:, pivot_col])))
+        a_max = A[i_max, pivot_col]
+        if a_max == 0:
+            pivot_col += 1
+            continue
+        A[[pivot_row, i_max]] = A[[i_max, pivot_row]]
+        f = A[pivot_row + 1 :, pivot_col] / a_max
+        A[pivot_row + 1 :, pivot_col + 1 :] -= np.outer(
+            f, A[pivot_row, pivot_col + 1 :]
+        )
+        A[pivot_row + 1 :, pivot_col] = 0
+        pivot_row += 1
+        pivot_col += 1
+
+    if not jordan:
+        return A.tolist()
+
+    if pivot_row >= n_rows:
+        pivot_row = n_rows - 1
+    while pivot_row >= 0:
+        nonzero = np.flatnonzero(A[pivot_row])
+        if nonzero.size:
+            j_lead = nonzero[0]
+            A[pivot_row, j_lead:] /= A[pivot_row, j_lead]
+            f = A[:pivot_row, j_lead].copy()
+            A[:pivot_row, j_lead:] -= np.outer(f, A[pivot_row, j_lead:])
+        pivot_row -= 1
+
+    return A.tolist()
+
+
+def clear_denominators(M: list[list[T]]) -> tuple[list[list[int]], list[int]]:
+    """Rows of M multiplied by the lcm of their denominators, and these
+    factors."""
+
+    A, factors = [], []
+    for row in M:
+        fractions = [Fraction(a) for a in row]
+        factor = math.lcm(*[a.denominator for a in fractions])
+        A.append([int(a * factor) for a in fractions])
+        factors.append(factor)
+    return A, factors
+
+
+def bareiss(M: list[list[Any]], jordan: bool = False) -> tuple[list[list[Any]], Any]:
+    """Fraction-free elimination of an integer or polynomial matrix.
+
+    Every entry stays a minor of M, so the division by the previous pivot
+    is exact and no fractions appear. With jordan the entries above the
+    pivots are eliminated too, leaving the pivots on the "diagonal".
+    Returns the eliminated matrix and the determinant of M if it is
+    square (in general, of the minor on the pivot rows and columns).
+    """
+
+    A, determinant, _ = _bareiss(M, jordan)
+    return A, determinant
+
+
+def _bareiss(
+    M: list[list[Any]], jordan: bool, scales: Optional[list[int]] = None
+) -> tuple[list[list[Any]], Any, list[int]]:
+    """bareiss, also returning the original index of every row.
+
+    Without scales the pivot is the first non-zero entry of its column.
+    With scales, the integer rows of M being rows of a rational matrix
+    multiplied by them, the pivot is the one gaussian_elimination picks:
+    largest in absolute value in the rational matrix, the first of equals.
+    """
+
+    A = [list(row) for row in M]
+    n_rows = len(A)
+    n_cols = len(A[0])
+
+    order = list(range(n_rows))
+    sign = 1
+    previous = 1
+    pivot_row = 0
+    pivot_col = 0
+
+    while pivot_row < n_rows and pivot_col < n_cols:
+        if scales is None:
+            i_pivot = next(
+                (i for i in range(pivot_row, n_rows) if A[i][pivot_col] != 0), None
+            )
+        else:
+            i_pivot, largest = None, 0
+            for i in range(pivot_row, n_rows):
+                size = Fraction(abs(A[i][pivot_col]), scales[order[i]])
+                if size > largest:
+                    i_pivot, largest = i, size
+        if i_pivot is None:
+            pivot_col += 1
+            continue
+        if i_pivot != pivot_row:
+            A[pivot_row], A[i_pivot] = A[i_pivot], A[pivot_row]
+            order[pivot_row], order[i_pivot] = order[i_pivot], order[pivot_row]
+            sign = -sign
+
+        pivot = A[pivot_row][pivot_col]
+        rows = range(n_rows) if jordan else range(pivot_row + 1, n_rows)
+        for i in rows:
+            if i == pivot_row:
+                continue
+            f = A[i][pivot_col]
+            # rows above the pivot still have entries in earlier columns
+            j_from = 0 if i < pivot_row else pivot_col + 1
+            for j in range(j_from, n_cols):
+                if j != pivot_col:
+                    A[i][j] = pivot * A[i][j] - f * A[pivot_row][j]
+                    if pivot_row:
+                        A[i][j] //= previous
+            A[i][pivot_col] = 0
+        previous = pivot
+        pivot_row += 1
+        pivot_col += 1
+
+    determinant = sign * previous if pivot_row == n_rows else 0
+    return A, determinant, order
+
+
+class LU:
+    """LU factorisation P A = L U of a square matrix with partial pivoting.
+
+    The multipliers of L are stored below the diagonal of U, so the matrix
+    is eliminated once and every solve only costs forward and back
+    substitution. Raises ZeroDivisionError if the matrix is singular.
+    """
+
+    def __init__(self, A: list[list[T]], inplace: bool = False) -> None:
+        n = len(A)
+        if any(len(row) != n for row in A):
+            raise ValueError("Matrix must be square")
+        self.LU = A if inplace else [list(row) for row in A]
+        self.permutation = list(range(n))
+        LU = self.LU
+
+        for k in range(n):
+            i_max = max(range(k, n), key=lambda i: abs(LU[i][k]))
+            if LU[i_max][k] == 0:
+                raise ZeroDivisionError("Singular matrix")
+            if i_max != k:
+                LU[k], LU[i_max] = LU[i_max], LU[k]
+                self.permutation[k], self.permutation[i_max] = (
+                    self.permutation[i_max],
+                    self.permutation[k],
+                )
+            pivot_row = LU[k]
+            pivot = pivot_row[k]
+            if isinstance(pivot, int):
+                pivot = Fraction(pivot)
+            for i in range(k + 1, n):
+                row = LU[i]
+                if row[k] == 0:
+                    continue
+                f = row[k] / pivot
+                row[k] = f
+                for j in range(k + 1, n):
+                    row[j] -= f * pivot_row[j]
+
+    def solve(self, B: list[list[T]]) -> list[list[T]]:
+        """Solution X of A X = B, B given by rows like in augment."""
+
+        LU = self.LU
+        n = len(LU)
+        X = [list(B[i]) for i in self.permutation]
+        n_cols = len(X[0]) if X else 0
+
+        for i in range(n):
+            x_i, row = X[i], LU[i]
+            for k in range(i):
+                if row[k] != 0:
+                    x_k = X[k]
+                    for j in range(n_cols):
+                        x_i[j] -= row[k] * x_k[j]
+
+        for i in range(n - 1, -1, -1):
+            x_i, row = X[i], LU[i]
+            for k in range(i + 1, n):
+                if row[k] != 0:
+                    x_k = X[k]
+                    for j in range(n_cols):
+                        x_i[j] -= row[k] * x_k[j]
+            pivot = row[i]
+            if isinstance(pivot, int):
+                pivot = Fraction(pivot)
+            X[i] = [x / pivot for x in x_i]
+
+        return X
+
+    def solve_vector(self, b: list[T]) -> list[T]:
+        """Solution x of A x = b."""
+
+        return [row[0] for row in self.solve([[b_i] for b_i in b])]
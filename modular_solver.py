@@ -0,0 +1,132 @@
+from fractions import Fraction
+from typing import Optional
+
+from functions.gcd import iter_primes
+from gaussian_elimination import bareiss, clear_denominators
+from number import rational_reconstruction
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def solve_mod_p(A: list[list[int]], b: list[int], p: int) -> Optional[list[int]]:
+    """Solution of A x = b modulo a prime p, None if A is singular mod p."""
+
+    n = len(A)
+    R = [[a % p for a in row] + [b_i % p] for row, b_i in zip(A, b)]
+
+    for k in range(n):
+        i_pivot = next((i for i in range(k, n) if R[i][k]), None)
+        if i_pivot is None:
+            return None
+        R[k], R[i_pivot] = R[i_pivot], R[k]
+        inverse = pow(R[k][k], -1, p)
+        R[k] = [a * inverse % p for a in R[k]]
+        pivot_row = R[k]
+        for i in range(n):
+            f = R[i][k]
+            if i != k and f:
+                R[i] = [(a - f * c) % p for a, c in zip(R[i], pivot_row)]
+
+    return [row[-1] for row in R]
+
+
+def solve_mod_p_numpy(A: list[list[int]], b: list[int], p: int) -> Optional[list[int]]:
+    """Same as solve_mod_p with row operations on an int64 array.
+
+    Residues are below functions.gcd.PRIME_BOUND = 2^31, so a product of
+    two fits into int64 and is reduced right away.
+    """
+
+    n = len(A)
+    R = np.array(
+        [[a % p for a in row] + [b_i % p] for row, b_i in zip(A, b)], dtype=np.int64
+    )
+
+    for k in range(n):
+        nonzero = np.flatnonzero(R[k:, k])
+        if not nonzero.size:
+            return None
+        i_pivot = k + int(nonzero[0])
+        if i_pivot != k:
+            R[[k, i_pivot], k:] = R[[i_pivot, k], k:]
+        R[k, k:] = R[k, k:] * pow(int(R[k, k]), -1, p) % p
+        below = R[k + 1 :, k:]
+        below -= np.outer(below[:, 0], R[k, k:]) % p
+        below %= p
+
+    # back substitution on the last column only
+    x = R[:, -1]
+    for k in range(n - 1, 0, -1):
+        x[:k] = (x[:k] - R[:k, k] * x[k]) % p
+
+    return [int(a) for a in x]
+
+
+def solve_modular(
+    A: list[list[Fraction]], b: list[Fraction], use_numpy: Optional[bool] = None
+) -> list[Fraction]:
+    """Exact solution of a square non-singular rational system A x = b.
+
+    Rows are scaled to integers, the system is solved modulo word-size
+    primes and the solutions are combined by the Chinese remainder theorem.
+    The rational solution is recovered by rational reconstruction; once it
+    is the same for two consecutive primes it is checked by substitution.
+    Primes dividing the determinant are skipped. Raises ZeroDivisionError
+    if A is singular.
+    """
+
+    n = len(A)
+    if n == 0:
+        return []
+    if any(len(row) != n for row in A):
+        raise ValueError("Matrix must be square")
+    if use_numpy is None:
+        use_numpy = np is not None
+
+    augmented, _ = clear_denominators([list(row) + [b_i] for row, b_i in zip(A, b)])
+    M = [row[:-1] for row in augmented]
+    y = [row[-1] for row in augmented]
+
+    solve = solve_mod_p_numpy if use_numpy else solve_mod_p
+    residues: list[int] = []
+    modulus = 1
+    candidate: Optional[list[Fraction]] = None
+    singular_primes = 0
+
+    for p in iter_primes():
+        x = solve(M, y, p)
+        if x is None:
+            singular_primes += 1
+            if singular_primes == 3 and bareiss(M)[1] == 0:
+                raise ZeroDivisionError("Singular matrix")
+            continue
+
+        if modulus == 1:
+            residues = x
+        else:
+            inverse = pow(modulus, -1, p)
+            residues = [
+                r + modulus * ((c - r) * inverse % p) for r, c in zip(residues, x)
+            ]
+        modulus *= p
+
+        reconstructed = []
+        for r in residues:
+            value = rational_reconstruction(r, modulus)
+            if value is None:
+                break
+            reconstructed.append(value)
+        else:
+            if reconstructed == candidate and all(
+                sum(a * x_j for a, x_j in zip(row, reconstructed)) == y_i
+                for row, y_i in zip(M, y)
+            ):
+                return reconstructed
+            candidate = reconstructed
+            continue
+        candidate = None
+
+    raise ArithmeticError("Ran out of primes")  # pragma: no cover
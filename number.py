@@ -1,4 +1,7 @@
+import math
+from fractions import Fraction
 from functools import lru_cache
+from typing import Generator
 
 
 @lru_cache
@@ -45,3 +48,59 @@ def falling_factorial(n: int, k: int) -> int:
         res *= i
 
     return res
+
+
+def is_prime(n: int) -> bool:
+    """Deterministic Miller-Rabin test, valid for n < 3.3 * 10^24"""
+
+    if n < 2:
+        return False
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    for p in bases:
+        if n % p == 0:
+            return n == p
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in bases:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def iter_primes_below(n: int) -> Generator[int, None, None]:
+    """Primes below n in descending order"""
+
+    for candidate in range(n - 1, 1, -1):
+        if is_prime(candidate):
+            yield candidate
+
+
+def crt(r1: int, m1: int, r2: int, m2: int) -> int:
+    """x mod m1 * m2 with x = r1 mod m1, x = r2 mod m2 for coprime moduli"""
+
+    return (r1 + m1 * ((r2 - r1) * pow(m1, -1, m2) % m2)) % (m1 * m2)
+
+
+def rational_reconstruction(a: int, m: int) -> Fraction | None:
+    """Fraction p/q with p = a q mod m and |p|, q <= sqrt(m / 2), if any"""
+
+    bound = math.isqrt(m // 2)
+    r0, r1 = m, a % m
+    t0, t1 = 0, 1
+    while r1 > bound:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        t0, t1 = t1, t0 - q * t1
+    if t1 == 0 or abs(t1) > bound or math.gcd(r1, t1) != 1:
+        return None
+    return Fraction(r1, t1)
@@ -0,0 +1,138 @@
+"""Append-only checkpoint file of a number wall build.
+
+The file starts with MAGIC followed by records, each a 4-byte little-endian
+length and a pickled payload. The first record is the sequence, every
+further one a completed row: its index, the first column of its stored
+slice, the values with None for empty cells and the zero windows that can
+still set rules below it. Rules are not stored, they are set again from the
+windows on resume. A record cut short by a crash is ignored, every record
+is synced to disk before the next row is computed.
+
+Payloads are unpickled with only the classes in SAFE_GLOBALS allowed, so
+a crafted file cannot run code, but it can still make the build compute
+garbage: only resume from checkpoints you wrote yourself.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import pickle
+import struct
+from dataclasses import dataclass
+from typing import Any, BinaryIO
+
+from number_wall.zero_window import ZeroWindow
+from table import empty
+
+MAGIC = b"NWCKPT1\n"
+LENGTH = struct.Struct("<I")
+
+# classes a checkpoint may contain: cell values and zero windows
+SAFE_GLOBALS = {
+    # FrozenPolynomial keeps its integers in an array
+    ("array", "_array_reconstructor"),
+    ("array", "array"),
+    ("fractions", "Fraction"),
+    ("functions.polynomial", "FrozenPolynomial"),
+    ("functions.polynomial", "Polynomial"),
+    ("functions.rational", "Rational"),
+    ("number_wall.frame", "Frame"),
+    ("number_wall.zero_window", "ZeroWindow"),
+    ("table", "Cell"),
+    ("table", "Direction"),
+}
+
+
+class CheckpointError(Exception):
+    pass
+
+
+class _Unpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) not in SAFE_GLOBALS:
+            raise CheckpointError(f"{module}.{name} is not allowed in a checkpoint")
+        return super().find_class(module, name)
+
+
+@dataclass
+class Checkpoint:
+    sequence: list
+    # completed rows as {row: (first stored column, values)}
+    rows: dict[int, tuple[int, list]]
+    # zero windows stored with the last row
+    zero_windows: list[ZeroWindow]
+    # length of the file up to the end of the last complete record
+    size: int
+
+
+class CheckpointWriter:
+    def __init__(self, path: str, sequence: list | None = None, size: int = 0) -> None:
+        """Starts a new file with the sequence, or if sequence is None
+        appends to an existing one after cutting it to size bytes."""
+
+        if sequence is None:
+            self.file: BinaryIO = open(path, "r+b")
+            self.file.truncate(size)
+            self.file.seek(size)
+            return
+        self.file = open(path, "wb")
+        self.file.write(MAGIC)
+        self._write(list(sequence))
+
+    def _write(self, payload: Any) -> None:
+        data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        self.file.write(LENGTH.pack(len(data)) + data)
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def write_row(
+        self, row: int, start: int, values: list, zero_windows: list[ZeroWindow]
+    ) -> None:
+        self._write(
+            (
+                row,
+                start,
+                [None if value is empty else value for value in values],
+                zero_windows,
+            )
+        )
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def read_checkpoint(path: str) -> Checkpoint:
+    with open(path, "rb") as fi:
+        if fi.read(len(MAGIC)) != MAGIC:
+            raise CheckpointError(f"{path} is not a number wall checkpoint")
+        payloads = []
+        size = len(MAGIC)
+        while True:
+            header = fi.read(LENGTH.size)
+            if len(header) < LENGTH.size:
+                break
+            length = LENGTH.unpack(header)[0]
+            data = fi.read(length)
+            if len(data) < length:
+                break
+            try:
+                payloads.append(_Unpickler(io.BytesIO(data)).load())
+            except CheckpointError:
+                raise
+            except Exception as error:
+                raise CheckpointError(
+                    f"{path} has a corrupt record at byte {size}"
+                ) from error
+            size += LENGTH.size + length
+
+    if not payloads:
+        raise CheckpointError(f"{path} has no sequence")
+    checkpoint = Checkpoint(payloads[0], {}, [], size)
+    for row, start, values, zero_windows in payloads[1:]:
+        checkpoint.rows[row] = (
+            start,
+            [empty if value is None else value for value in values],
+        )
+        checkpoint.zero_windows = zero_windows
+    return checkpoint
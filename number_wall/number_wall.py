@@ -1,30 +1,56 @@
 from __future__ import annotations
 
 import itertools
-from typing import Generator, cast
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Generator, cast
 
-from computational_dag import ComputationalDAG
+from computational_dag import ComputationalDAG, make_executor, run_parallel
 from iter_helpers import iter_consecutive_zeros
+from number_wall.checkpoint import CheckpointWriter, read_checkpoint
 from number_wall.frame import WindowFrame
 from number_wall.rules import (AbstractRule, CrossRule, HorseshoeInnerRule,
                                HorseshoeOuterRule, LongCrossRule,
                                UncomputableRule, ZeroRule)
 from number_wall.zero_window import ZeroWindow
-from table import Cell, Direction, GetterFn, Table, empty
+from table import Cell, Direction, GetterFn, Table, TrapezoidTable, empty
+
+
+# Rows shorter than this are computed in the calling process.
+PARALLEL_MIN_ROW = 64
+
+
+def cross_values(center: list, above: list) -> list:
+    """(c^2 - l r) / u for the cells below center[1:-1]."""
+
+    return [
+        (c**2 - left * right) / up
+        for left, c, right, up in zip(center, center[1:], center[2:], above)
+    ]
 
 
 class NumberWall:
-    def __init__(self, sequence) -> None:
+    def __init__(self, sequence, storage: str = "trapezoid") -> None:
         self.sequence = sequence
         self.cols = len(sequence)
         self.rows = (self.cols + 1) // 2 + 2
 
-        self.table = Table(self.rows, self.cols, self.initial_filler)
+        if storage == "trapezoid":
+            self.table = TrapezoidTable(
+                self.rows, self.cols, self.row_bounds, self.initial_filler
+            )
+        else:
+            self.table = Table(
+                self.rows, self.cols, self.initial_filler, storage=storage
+            )
         self.dag = ComputationalDAG(
             precomputed_nodes=[Cell(i, j) for i in range(3) for j in range(self.cols)]
         )
         self.rules: dict[Cell, AbstractRule] = {}
+        self.rows_with_rules: set[int] = set()
         self.zero_windows: list[ZeroWindow] = []
+        # rows above this one were restored from a checkpoint
+        self.restored_rows = 0
 
     def initial_filler(self, i: int, j: int, T: GetterFn):
         if i == 0:
@@ -35,6 +61,11 @@ class NumberWall:
             return self.sequence[j]
         return empty
 
+    def row_bounds(self, row: int) -> tuple[int, int]:
+        if row <= 2:
+            return 0, self.cols
+        return row - 2, self.cols - row + 2
+
     def is_inside_table(self, cell: Cell) -> bool:
         return (0 <= cell.row <= 2 and 0 <= cell.col < self.cols) or (
             2 < cell.row < self.rows
@@ -46,7 +77,7 @@ class NumberWall:
             yield Cell(row, j)
 
     def set_rule(self, cell: Cell, rule: AbstractRule) -> None:
-        if not self.is_inside_table(cell):
+        if cell.row < self.restored_rows or not self.is_inside_table(cell):
             return
         for dependence in rule.get_dependencies():
             if not self.is_inside_table(dependence):
@@ -54,7 +85,15 @@ class NumberWall:
         if cell in self.rules:
             return
         self.rules[cell] = rule
-        self.dag.add_node(cell, rule.get_dependencies())
+        self.rows_with_rules.add(cell.row)
+        dependencies = rule.get_dependencies()
+        # cells of rows computed directly are not in the DAG yet
+        self.dag.add_precomputed_nodes(
+            dependence
+            for dependence in dependencies
+            if dependence not in self.dag and self.table[dependence] is not empty
+        )
+        self.dag.add_node(cell, dependencies)
 
     def init_new_zero_window(self, row: int, col_left: int, col_right: int) -> None:
         zero_window = ZeroWindow.from_top_row(
@@ -62,10 +101,12 @@ class NumberWall:
         )
         self.zero_windows.append(zero_window)
         zero_window.calculate_factors(self.table)
+        self.set_zero_window_rules(zero_window)
 
+    def set_zero_window_rules(self, zero_window: ZeroWindow) -> None:
         # set zero rules inside window
         for cell in zero_window.iter_inside_region():
-            if cell.row > row:
+            if cell.row > zero_window.top_left.row:
                 self.set_rule(cell, ZeroRule())
 
         # set bottom inner frame rule
@@ -100,9 +141,7 @@ class NumberWall:
     def setup_row(self, row: int) -> None:
         for zeros in iter_consecutive_zeros(self.table.get_row(row)):
             if zeros[0] == zeros[1]:
-                # single zero
-                cell = Cell(row, zeros[0])[Direction.DOWN, 2]
-                self.set_rule(cell, LongCrossRule(cell))
+                self.set_long_cross_rule(Cell(row, zeros[0]))
             else:
                 # zero window
                 for zero_window in self.zero_windows:
@@ -114,23 +153,180 @@ class NumberWall:
         for cell in self.iter_row(row + 1):
             self.set_rule(cell, CrossRule(cell))
 
-    def build(self) -> None:
-        for row in range(2, self.rows):
-            if self.table.all_in_row(row, lambda x: x == 0):
-                break
-            self.setup_row(row)
+    def set_long_cross_rule(self, zero: Cell) -> None:
+        """Rule for the cell two rows below a single zero."""
+
+        cell = zero[Direction.DOWN, 2]
+        self.set_rule(cell, LongCrossRule(cell))
+
+    def compute_next_row(
+        self, row: int, executor: Executor | None = None, workers: int = 1
+    ) -> bool:
+        """Computes row + 1 by the cross rule (c^2 - l r) / u in one loop,
+        bypassing rules and the DAG. Only possible if row has neither zeros
+        nor empty cells, the u values in row - 1 are non-zero and no rules
+        were set in row + 1 by zero windows above. Returns whether the row
+        was computed."""
+
+        if row + 1 in self.rows_with_rules:
+            return False
+        start, end = row - 1, self.cols - row + 1
+        center = self.table.get_row(row)[start - 1 : end + 1]
+        above = self.table.get_row(row - 1)[start:end]
+        if any(value is empty or value == 0 for value in center) or any(
+            value is empty or value == 0 for value in above
+        ):
+            return False
+
+        if executor is None or len(above) < PARALLEL_MIN_ROW:
+            values = cross_values(center, above)
+        else:
+            size = -(-len(above) // workers)
+            values = []
+            for chunk in executor.map(
+                cross_values,
+                [center[i : i + size + 2] for i in range(0, len(above), size)],
+                [above[i : i + size] for i in range(0, len(above), size)],
+            ):
+                values.extend(chunk)
+        self.table.set_row(
+            row + 1, [empty] * start + values + [empty] * (self.cols - end)
+        )
+        # placeholders of dependencies of rules set in the rows below
+        self.dag.add_precomputed_nodes(
+            cell for cell in self.iter_row(row + 1) if cell in self.dag
+        )
+        return True
+
+    def make_task(self, cell: Cell) -> partial:
+        """Rule of the cell bound to the values of its dependencies, to be
+        evaluated in another process."""
 
-            for label in self.dag.iter_computable_nodes():
-                cell = cast(Cell, label)
-                value = self.rules[cell](self.table)
-                # if hasattr(value, "cancel"):
-                #     value = value.cancel()
-                self.table[cell] = value
-                self.dag.done(cell)
+        rule = self.rules[cell]
+        values = {
+            dependence: self.table[dependence]
+            for dependence in rule.get_dependencies()
+        }
+        return partial(rule, values)
+
+    def set_value(self, cell: Cell, value: Any) -> None:
+        self.table[cell] = value
+
+    def build(
+        self,
+        fast: bool = True,
+        workers: int | None = None,
+        checkpoint: str | None = None,
+    ) -> None:
+        """Fills the wall row by row. With fast, rows following zero-free
+        rows are computed directly, the rules and the DAG are only used
+        around zeros. With workers, cells of a row are evaluated in that
+        many processes. With checkpoint, every completed row is appended to
+        that file, see resume."""
+
+        writer = CheckpointWriter(checkpoint, self.sequence) if checkpoint else None
+        self._run(2, fast, workers, writer)
+
+    @classmethod
+    def resume(
+        cls,
+        path: str,
+        fast: bool = True,
+        workers: int | None = None,
+        storage: str = "trapezoid",
+    ) -> NumberWall:
+        """Continues a build from the last completed row in the checkpoint
+        file, appending the following rows to it.
+
+        Rules are set again: those of the zero windows stored with the last
+        row and long cross rules below single zeros of the row before it.
+        Rules of restored rows are skipped. The file is unpickled with only
+        the value and zero window classes allowed, still only resume from
+        checkpoints of a trusted source.
+        """
+
+        checkpoint = read_checkpoint(path)
+        wall = cls(checkpoint.sequence, storage)
+        last = max(checkpoint.rows, default=2)
+        for row, (start, values) in checkpoint.rows.items():
+            end = start + len(values)
+            wall.table.set_row(
+                row, [empty] * start + values + [empty] * (wall.cols - end)
+            )
+        wall.restored_rows = last + 1
+
+        wall.zero_windows = checkpoint.zero_windows
+        for zero_window in wall.zero_windows:
+            wall.set_zero_window_rules(zero_window)
+        for zeros in iter_consecutive_zeros(wall.table.get_row(last - 1)):
+            if zeros[0] == zeros[1]:
+                wall.set_long_cross_rule(Cell(last - 1, zeros[0]))
+
+        wall._run(last, fast, workers, CheckpointWriter(path, size=checkpoint.size))
+        return wall
+
+    def write_checkpoint(self, writer: CheckpointWriter, row: int) -> None:
+        start, end = self.row_bounds(row)
+        writer.write_row(
+            row,
+            start,
+            self.table.get_row(row)[start:end],
+            # windows whose outer bottom frame is below the row
+            [w for w in self.zero_windows if w.bottom_right.row + 2 > row],
+        )
+
+    def _run(
+        self,
+        start_row: int,
+        fast: bool,
+        workers: int | None,
+        writer: CheckpointWriter | None,
+    ) -> None:
+        executor = make_executor(workers) if workers and workers > 1 else None
+        try:
+            self._build(start_row, fast, executor, workers or 1, writer)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            if writer is not None:
+                writer.close()
 
         self.table.truncate_zero_rows()
         self.rows = self.table.rows
 
+    def _build(
+        self,
+        start_row: int,
+        fast: bool,
+        executor: Executor | None,
+        workers: int,
+        writer: CheckpointWriter | None,
+    ) -> None:
+        for row in range(start_row, self.rows):
+            if self.table.all_in_row(row, lambda x: x == 0):
+                break
+            if not (
+                fast
+                and row + 1 < self.rows
+                and self.compute_next_row(row, executor, workers)
+            ):
+                self.setup_row(row)
+                self.evaluate_rules(executor, workers)
+            if writer is not None and row + 1 < self.rows:
+                self.write_checkpoint(writer, row + 1)
+
+    def evaluate_rules(self, executor: Executor | None, workers: int) -> None:
+        if executor is not None:
+            run_parallel(self.dag, self.make_task, self.set_value, executor, workers)
+            return
+        for label in self.dag.iter_computable_nodes():
+            cell = cast(Cell, label)
+            value = self.rules[cell](self.table)
+            # if hasattr(value, "cancel"):
+            #     value = value.cancel()
+            self.table[cell] = value
+            self.dag.done(cell)
+
     def get_constant_element(self):
         last_row = [self.table[item] for item in self.iter_row(self.rows - 1)]
         if all(item == last_row[0] or -item == last_row[0] for item in last_row):
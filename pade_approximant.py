@@ -1,36 +1,77 @@
+import math
 from fractions import Fraction
 from typing import Any
 
 import gaussian_elimination as ge
+from functions.polynomial import Polynomial
+from functions.rational import Rational
+from modular_solver import solve_modular
+from toeplitz import levinson
 
 
 def pade_approximant(
     taylor_coeffs: list[Any],
     num_degree: int,
     denom_degree: int,
+    method: str = "levinson",
 ) -> tuple[list, list]:
-    """Calculate Padé approximant P/Q coefficients from Taylor series coefficients."""
+    """Calculate Padé approximant P/Q coefficients from Taylor series coefficients.
+
+    The denominator solves a Toeplitz system, by Levinson recursion in
+    O(n^2) ("levinson"), modulo primes ("modular"), by LU factorisation
+    ("lu") or by Gauss-Jordan elimination ("gaussian", the reference).
+    The others fall back to elimination when they break down on a
+    singular (leading) minor.
+    """
 
     if num_degree + denom_degree > len(taylor_coeffs) - 1:
         raise ValueError(
             "Tailor series degree must be >= then sum of polynomial degrees"
         )
+    if method not in ("levinson", "modular", "lu", "gaussian"):
+        raise ValueError(f"Unknown method {method}")
 
     T = [Fraction(t) for t in taylor_coeffs]
-
-    A = [
-        [
-            -T[i - j + num_degree] if i - j + num_degree >= 0 else Fraction(0)
-            for j in range(denom_degree)
+    t = [T[i + num_degree + 1] for i in range(denom_degree)]
+
+    def denominator_matrix() -> list[list[Fraction]]:
+        return [
+            [
+                -T[i - j + num_degree] if i - j + num_degree >= 0 else Fraction(0)
+                for j in range(denom_degree)
+            ]
+            for i in range(denom_degree)
         ]
-        for i in range(denom_degree)
-    ]
-    t = [[T[i + num_degree + 1]] for i in range(denom_degree)]
 
-    A_augmented = ge.augment(A, t)
-    A_eliminated = ge.gaussian_elimination(A_augmented, jordan=True)
-
-    Q = [row[-1] for row in A_eliminated]
+    Q = None
+    if method == "levinson":
+        try:
+            Q = levinson(
+                [-T[num_degree + i] for i in range(denom_degree)],
+                [
+                    -T[num_degree - j] if num_degree - j >= 0 else Fraction(0)
+                    for j in range(denom_degree)
+                ],
+                t,
+            )
+        except ZeroDivisionError:
+            pass
+    elif method == "modular":
+        try:
+            Q = solve_modular(denominator_matrix(), t)
+        except ZeroDivisionError:
+            pass
+    elif method == "lu":
+        try:
+            Q = ge.LU(denominator_matrix(), inplace=True).solve_vector(t)
+        except ZeroDivisionError:
+            pass
+
+    if Q is None:
+        A_augmented = ge.augment(denominator_matrix(), [[t_i] for t_i in t])
+        A_eliminated = ge.gaussian_elimination(A_augmented, jordan=True, inplace=True)
+
+        Q = [row[-1] for row in A_eliminated]
 
     P = [T[i] for i in range(num_degree + 1)]
 
@@ -43,11 +84,134 @@ def pade_approximant(
     return P, Q
 
 
+def _euclid_antidiagonal(
+    T: list[Fraction], order: int, max_denom_degree: int | None = None
+) -> list[tuple[Polynomial, Polynomial]]:
+    """Numerators and denominators of [order - M / M] for M = 0..order, or
+    only up to M = max_denom_degree.
+
+    Extended Euclidean algorithm on x^(order + 1) and T mod x^(order + 1):
+    every remainder r = t T mod x^(order + 1) with deg r <= L, deg t <= M
+    is a Padé form, the first one of degree <= L gives [L / order - L].
+    """
+
+    r0, r1 = Polynomial(*([0] * (order + 1) + [1])), Polynomial(*T[: order + 1])
+    r1._truncate()
+    t0, t1 = Polynomial(0), Polynomial(1)
+    forms = []
+    num_degree = order
+    min_num_degree = 0 if max_denom_degree is None else order - max_denom_degree
+    while num_degree >= min_num_degree:
+        while num_degree >= min_num_degree and (r1 == 0 or r1.degree <= num_degree):
+            forms.append((r1, t1))
+            num_degree -= 1
+        if r1 == 0 or num_degree < min_num_degree:
+            break
+        q, r = divmod(r0, r1)
+        r0, r1 = r1, r
+        t0, t1 = t1, t0 - q * t1
+        r1, t1 = _normalize_form(r1, t1)
+    return forms
+
+
+def _normalize_form(r: Polynomial, t: Polynomial) -> tuple[Polynomial, Polynomial]:
+    """Scale a Padé form to integer coefficients without a common factor.
+
+    Every step of the Euclidean algorithm stays valid when a pair (r, t) is
+    scaled, this keeps the contents from growing.
+    """
+
+    (content1, _), (content2, _) = r.primitive(), t.primitive()
+    if r == 0:
+        return r, t / content2
+    content = Fraction(
+        math.gcd(content1.numerator, content2.numerator),
+        math.lcm(content1.denominator, content2.denominator),
+    )
+    return r / content, t / content
+
+
+def _to_rational(P: Polynomial, Q: Polynomial) -> Rational:
+    """Reduced P/Q for a Padé form from _euclid_antidiagonal.
+
+    The cofactors s, t of s x^n + t T = r are coprime, so the only common
+    factor of r and t is a power of x and no gcd has to be computed.
+    """
+
+    if P == 0:
+        return Rational(0)
+    shift = min(
+        next(k for k, c in enumerate(X.coefficients) if c != 0) for X in (P, Q)
+    )
+    Q_coeffs = Q.coefficients[shift:]
+    lowest = next(c for c in Q_coeffs if c != 0)
+    return Rational.from_coprime(
+        Polynomial(*P.coefficients[shift:]) / lowest,
+        Polynomial(*Q_coeffs) / lowest,
+    )
+
+
+def pade_rational(
+    taylor_coeffs: list[Any],
+    num_degree: int,
+    denom_degree: int,
+) -> Rational:
+    """Padé approximant [num_degree / denom_degree] via the extended
+    Euclidean algorithm, in near-quadratic time."""
+
+    order = num_degree + denom_degree
+    if order > len(taylor_coeffs) - 1:
+        raise ValueError(
+            "Tailor series degree must be >= then sum of polynomial degrees"
+        )
+
+    T = [Fraction(t) for t in taylor_coeffs]
+    forms = _euclid_antidiagonal(T, order, denom_degree)
+    return _to_rational(*forms[denom_degree])
+
+
+def pade_antidiagonal(taylor_coeffs: list[Any], order: int) -> list[Rational]:
+    """Padé approximants [order - M / M] for M = 0..order in one pass."""
+
+    if order > len(taylor_coeffs) - 1:
+        raise ValueError("Tailor series degree must be >= then order")
+
+    T = [Fraction(t) for t in taylor_coeffs]
+    return [_to_rational(P, Q) for P, Q in _euclid_antidiagonal(T, order)]
+
+
+def pade_table(
+    taylor_coeffs: list[Any],
+    max_num_degree: int,
+    max_denom_degree: int,
+) -> list[list[Rational]]:
+    """Padé table: table[L][M] is the approximant [L / M].
+
+    The Euclidean remainder sequence of x^(n + 1) and T only yields the
+    antidiagonal L + M = n, so one sequence is run per antidiagonal. Each
+    is stopped at M = max_denom_degree, and rational functions are only
+    built for L <= max_num_degree.
+    """
+
+    order = max_num_degree + max_denom_degree
+    if order > len(taylor_coeffs) - 1:
+        raise ValueError(
+            "Tailor series degree must be >= then sum of polynomial degrees"
+        )
+
+    T = [Fraction(t) for t in taylor_coeffs]
+    table: list[list[Rational]] = [[] for _ in range(max_num_degree + 1)]
+    for n in range(order + 1):
+        forms = _euclid_antidiagonal(T, n, min(n, max_denom_degree))
+        for M in range(max(0, n - max_num_degree), len(forms)):
+            table[n - M].append(_to_rational(*forms[M]))
+    return table
+
+
 if __name__ == "__main__":
-    from functions.polynomial import Polynomial
-    from functions.rational import Rational
+    from functions.power_series import PowerSeries
 
-    T = [1, 1, "1/2", "1/6", "1/24"]
+    T = PowerSeries(0, 1, precision=5).exp()
     P, Q = pade_approximant(T, 2, 2)
     R = Rational(Polynomial(*P), Polynomial(*Q))
 
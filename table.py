@@ -4,6 +4,11 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 
 class Direction(Enum):
     RIGHT = (0, 1)
@@ -70,23 +75,54 @@ empty = Empty()
 
 
 class Table:
-    def __init__(self, rows: int, cols: int, filler: FillerFn | None = None) -> None:
+    """Dense table of values, unset cells read as `empty`.
+
+    storage selects how the cells are kept: "list" (list of row lists),
+    "flat" (one list with row stride and a validity bytearray), "numpy"
+    / "int64" (NumPy array of that dtype and a boolean validity mask) or
+    "sparse" (dict of rows). Every storage has the same interface, see
+    also TrapezoidTable for tables filled only in a band of columns.
+    """
+
+    def __new__(cls, *args, storage: str = "list", **kwargs) -> Table:
+        if cls is Table and len(args) > 3:
+            raise TypeError("Table storage must be passed as a keyword argument")
+        if cls is Table and storage != "list":
+            if storage not in STORAGES:
+                raise ValueError(f"Unknown storage {storage!r}")
+            cls = STORAGES[storage]
+        return super().__new__(cls)
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        filler: FillerFn | None = None,
+        *,
+        storage: str = "list",
+    ) -> None:
         self.rows = rows
         self.cols = cols
-        self._table = [[empty for _ in range(cols)] for _ in range(rows)]
+        self._allocate()
 
         if filler:
             for i in range(self.rows):
-                for j in range(self.cols):
-                    self._table[i][j] = filler(i, j, self.__getitem__)
+                for j in self._row_range(i):
+                    self[i, j] = filler(i, j, self.__getitem__)
+
+    def _row_range(self, row: int) -> range:
+        return range(self.cols)
+
+    def _allocate(self) -> None:
+        self._table = [[empty for _ in range(self.cols)] for _ in range(self.rows)]
 
     def __getitem__(self, key: tuple[int, int] | Cell):
-        if isinstance(key, Cell):
+        if key.__class__ is Cell:
             return self._table[key.row][key.col]
         return self._table[key[0]][key[1]]
 
     def __setitem__(self, key: tuple[int, int] | Cell, value):
-        if isinstance(key, Cell):
+        if key.__class__ is Cell:
             self._table[key.row][key.col] = value
             return
         self._table[key[0]][key[1]] = value
@@ -94,6 +130,9 @@ class Table:
     def get_row(self, row):
         return self._table[row]
 
+    def set_row(self, row: int, values) -> None:
+        self._table[row] = list(values)
+
     def get_col(self, col):
         return [row[col] for row in self._table]
 
@@ -114,7 +153,7 @@ class Table:
         self.rows = row
 
     def all_in_row(self, row: int, predicate: Callable[[Any], bool]) -> bool:
-        return all(value == empty or predicate(value) for value in self._table[row])
+        return all(value == empty or predicate(value) for value in self.get_row(row))
 
     def truncate_zero_rows(self) -> None:
         all_zeros = [
@@ -129,13 +168,14 @@ class Table:
         if self.rows == 0 or self.cols == 0:
             return "<empty>"
 
+        table = [self.get_row(i) for i in range(self.rows)]
         max_len_per_col = [
-            max(len(str(self._table[i][j])) for i in range(self.rows))
+            max(len(str(table[i][j])) for i in range(self.rows))
             for j in range(self.cols)
         ]
 
         lines = []
-        for row in self._table:
+        for row in table:
             lines.append(
                 " ".join(
                     f"{str(value):>{max_len_per_col[j]}}" for j, value in enumerate(row)
@@ -146,8 +186,338 @@ class Table:
 
     def to_tsv(self, filename: str) -> None:
         with open(filename, "w") as fo:
-            for row in self._table:
-                fo.write("\t".join(str(value) for value in row) + "\n")
+            for i in range(self.rows):
+                fo.write("\t".join(str(value) for value in self.get_row(i)) + "\n")
+
+
+class FlatTable(Table):
+    """Cells in one list, cell (i, j) at i * cols + j, with a bytearray
+    marking which cells are set instead of storing `empty`."""
+
+    def _allocate(self) -> None:
+        self._values: list[Any] = [None] * (self.rows * self.cols)
+        self._valid = bytearray(self.rows * self.cols)
+
+    def _index(self, key: tuple[int, int] | Cell) -> int:
+        i, j = (key.row, key.col) if key.__class__ is Cell else key
+        # an unchecked column would alias a cell of the neighbouring row
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError(f"Cell {key} is outside of the table")
+        return i * self.cols + j
+
+    def _check_row(self, row: int) -> None:
+        if not 0 <= row < self.rows:
+            raise IndexError(f"Row {row} is outside of the table")
+
+    def __getitem__(self, key: tuple[int, int] | Cell):
+        index = self._index(key)
+        return self._values[index] if self._valid[index] else empty
+
+    def __setitem__(self, key: tuple[int, int] | Cell, value):
+        index = self._index(key)
+        self._values[index] = value
+        self._valid[index] = value is not empty
+
+    def get_row(self, row):
+        self._check_row(row)
+        start = row * self.cols
+        end = start + self.cols
+        return [
+            value if valid else empty
+            for value, valid in zip(self._values[start:end], self._valid[start:end])
+        ]
+
+    def set_row(self, row: int, values) -> None:
+        self._check_row(row)
+        start = row * self.cols
+        values = list(values)
+        self._values[start : start + self.cols] = values
+        self._valid[start : start + self.cols] = bytes(
+            value is not empty for value in values
+        )
+
+    def get_col(self, col):
+        return [
+            value if valid else empty
+            for value, valid in zip(
+                self._values[col :: self.cols], self._valid[col :: self.cols]
+            )
+        ]
+
+    def add_row(self, filler: FillerFn | None = None) -> None:
+        self._values.extend([None] * self.cols)
+        self._valid.extend(bytes(self.cols))
+        self.rows += 1
+        if filler:
+            for j in range(self.cols):
+                self[self.rows - 1, j] = filler(self.rows - 1, j, self.__getitem__)
+
+    def truncate_rows(self, row: int) -> None:
+        if row > self.rows or row < 0:
+            return
+
+        del self._values[row * self.cols :]
+        del self._valid[row * self.cols :]
+        self.rows = row
+
+    def all_in_row(self, row: int, predicate: Callable[[Any], bool]) -> bool:
+        start = row * self.cols
+        end = start + self.cols
+        return all(
+            predicate(value)
+            for value, valid in zip(self._values[start:end], self._valid[start:end])
+            if valid
+        )
+
+
+class NumpyTable(Table):
+    """Cells in a 2-D NumPy array with a boolean mask of set cells.
+
+    dtype is object for arbitrary values or int64 for machine integers,
+    assigning an integer that does not fit into int64 raises OverflowError.
+    """
+
+    dtype: Any = object
+
+    def _allocate(self) -> None:
+        if np is None:
+            raise ImportError("NumPy storage needs numpy installed")
+        self._values = np.zeros((self.rows, self.cols), dtype=self.dtype)
+        self._valid = np.zeros((self.rows, self.cols), dtype=bool)
+
+    def _item(self, value):
+        return value if self.dtype is object else value.item()
+
+    def _check(self, value) -> None:
+        pass
+
+    def __getitem__(self, key: tuple[int, int] | Cell):
+        if key.__class__ is Cell:
+            key = key.row, key.col
+        return self._item(self._values[key]) if self._valid[key] else empty
+
+    def __setitem__(self, key: tuple[int, int] | Cell, value):
+        if key.__class__ is Cell:
+            key = key.row, key.col
+        if value is empty:
+            self._valid[key] = False
+            return
+        self._check(value)
+        self._values[key] = value
+        self._valid[key] = True
+
+    def get_row(self, row):
+        return [
+            value if valid else empty
+            for value, valid in zip(
+                self._values[row].tolist(), self._valid[row].tolist()
+            )
+        ]
+
+    def set_row(self, row: int, values) -> None:
+        values = list(values)
+        valid = [value is not empty for value in values]
+        for value, ok in zip(values, valid):
+            if ok:
+                self._check(value)
+        self._values[row] = [value if ok else 0 for value, ok in zip(values, valid)]
+        self._valid[row] = valid
+
+    def get_col(self, col):
+        return [
+            value if valid else empty
+            for value, valid in zip(
+                self._values[:, col].tolist(), self._valid[:, col].tolist()
+            )
+        ]
+
+    def add_row(self, filler: FillerFn | None = None) -> None:
+        self._values = np.vstack(
+            [self._values, np.zeros((1, self.cols), dtype=self.dtype)]
+        )
+        self._valid = np.vstack([self._valid, np.zeros((1, self.cols), dtype=bool)])
+        self.rows += 1
+        if filler:
+            for j in range(self.cols):
+                self[self.rows - 1, j] = filler(self.rows - 1, j, self.__getitem__)
+
+    def truncate_rows(self, row: int) -> None:
+        if row > self.rows or row < 0:
+            return
+
+        self._values = self._values[:row]
+        self._valid = self._valid[:row]
+        self.rows = row
+
+    def all_in_row(self, row: int, predicate: Callable[[Any], bool]) -> bool:
+        return all(
+            predicate(self._item(value))
+            for value in self._values[row][self._valid[row]]
+        )
+
+
+class Int64Table(NumpyTable):
+    dtype = np.int64 if np is not None else None
+
+    def _check(self, value) -> None:
+        # NumPy would silently truncate floats and Fractions to int64
+        if not isinstance(value, (int, np.integer)):
+            raise TypeError(f"int64 storage only holds integers, got {value!r}")
+
+
+class TrapezoidTable(Table):
+    """Table with a column range per row, only these cells are allocated.
+
+    bounds(i) gives the half-open column range [start, end) of row i, cells
+    outside it read as `empty` and cannot be set. Triangular tables and
+    the trapezoid of a number wall are the common cases.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        bounds: Callable[[int], tuple[int, int]],
+        filler: FillerFn | None = None,
+    ) -> None:
+        self.bounds = bounds
+        super().__init__(rows, cols, filler)
+
+    def _row_range(self, row: int) -> range:
+        start, end = self.bounds(row)
+        return range(max(start, 0), min(end, self.cols))
+
+    def _allocate(self) -> None:
+        self._starts: list[int] = []
+        self._table = []
+        for i in range(self.rows):
+            self._append_row(i)
+
+    def _append_row(self, row: int) -> None:
+        columns = self._row_range(row)
+        self._starts.append(columns.start)
+        self._table.append([empty] * len(columns))
+
+    def __getitem__(self, key: tuple[int, int] | Cell):
+        if key.__class__ is Cell:
+            i, j = key.row, key.col
+        else:
+            i, j = key
+        row = self._table[i]
+        j -= self._starts[i]
+        return row[j] if 0 <= j < len(row) else empty
+
+    def __setitem__(self, key: tuple[int, int] | Cell, value):
+        if key.__class__ is Cell:
+            i, j = key.row, key.col
+        else:
+            i, j = key
+        row = self._table[i]
+        j -= self._starts[i]
+        if not 0 <= j < len(row):
+            if value is empty:
+                return
+            raise IndexError(f"Cell {key} is outside of the table")
+        row[j] = value
+
+    def get_row(self, row):
+        start = self._starts[row]
+        values = self._table[row]
+        return [empty] * start + values + [empty] * (self.cols - start - len(values))
+
+    def set_row(self, row: int, values) -> None:
+        start = self._starts[row]
+        self._table[row] = list(values)[start : start + len(self._table[row])]
+
+    def get_col(self, col):
+        return [self[i, col] for i in range(self.rows)]
+
+    def add_row(self, filler: FillerFn | None = None) -> None:
+        self._append_row(self.rows)
+        self.rows += 1
+        if filler:
+            for j in self._row_range(self.rows - 1):
+                self[self.rows - 1, j] = filler(self.rows - 1, j, self.__getitem__)
+
+    def truncate_rows(self, row: int) -> None:
+        if row > self.rows or row < 0:
+            return
+
+        del self._table[row:]
+        del self._starts[row:]
+        self.rows = row
+
+    def all_in_row(self, row: int, predicate: Callable[[Any], bool]) -> bool:
+        return all(value == empty or predicate(value) for value in self._table[row])
+
+
+class SparseTable(Table):
+    """Dict of rows, each a dict from column to value. Only set cells are
+    stored, assigning `empty` removes a cell."""
+
+    def _allocate(self) -> None:
+        self._rows: dict[int, dict[int, Any]] = {}
+
+    def _cell(self, key: tuple[int, int] | Cell) -> tuple[int, int]:
+        i, j = (key.row, key.col) if key.__class__ is Cell else key
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError(f"Cell {key} is outside of the table")
+        return i, j
+
+    def _check_row(self, row: int) -> None:
+        if not 0 <= row < self.rows:
+            raise IndexError(f"Row {row} is outside of the table")
+
+    def __getitem__(self, key: tuple[int, int] | Cell):
+        i, j = self._cell(key)
+        row = self._rows.get(i)
+        return empty if row is None else row.get(j, empty)
+
+    def __setitem__(self, key: tuple[int, int] | Cell, value):
+        i, j = self._cell(key)
+        if value is empty:
+            self._rows.get(i, {}).pop(j, None)
+            return
+        self._rows.setdefault(i, {})[j] = value
+
+    def get_row(self, row):
+        self._check_row(row)
+        values = self._rows.get(row, {})
+        return [values.get(j, empty) for j in range(self.cols)]
+
+    def set_row(self, row: int, values) -> None:
+        self._check_row(row)
+        self._rows[row] = {
+            j: value for j, value in enumerate(values) if value is not empty
+        }
+
+    def get_col(self, col):
+        return [self[i, col] for i in range(self.rows)]
+
+    def add_row(self, filler: FillerFn | None = None) -> None:
+        self.rows += 1
+        if filler:
+            for j in range(self.cols):
+                self[self.rows - 1, j] = filler(self.rows - 1, j, self.__getitem__)
+
+    def truncate_rows(self, row: int) -> None:
+        if row > self.rows or row < 0:
+            return
+
+        for i in [i for i in self._rows if i >= row]:
+            del self._rows[i]
+        self.rows = row
+
+    def all_in_row(self, row: int, predicate: Callable[[Any], bool]) -> bool:
+        return all(predicate(value) for value in self._rows.get(row, {}).values())
+
+
+STORAGES: dict[str, type[Table]] = {
+    "flat": FlatTable,
+    "numpy": NumpyTable,
+    "int64": Int64Table,
+    "sparse": SparseTable,
+}
 
 
 # T = Table(5, 10, lambda i, j, _: i + j)
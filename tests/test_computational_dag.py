@@ -0,0 +1,122 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pytest
+
+import computational_dag
+from computational_dag import (ComputationalDAG, CycleError, NodeStatus,
+                               NodeStatusError, run_parallel)
+
+
+def _run(dag):
+    order = []
+    for label in dag.iter_computable_nodes():
+        order.append(label)
+        dag.done(label)
+    return order
+
+
+def test_topological_order():
+    dag = ComputationalDAG(precomputed_nodes=["a"])
+    dag.add_node("d", ["b", "c"])
+    dag.add_node("b", ["a"])
+    dag.add_node("c", ["b"])
+    order = _run(dag)
+    assert order == ["b", "c", "d"]
+    assert dag.undone_count == 0
+
+
+def test_incremental():
+    dag = ComputationalDAG(precomputed_nodes=["a"])
+    dag.add_node("b", ["a"])
+    assert _run(dag) == ["b"]
+    assert _run(dag) == []
+    dag.add_node("c", ["b", "a"])
+    dag.add_node("d")
+    assert sorted(_run(dag)) == ["c", "d"]
+
+
+def test_undefined_dependency_blocks_descendants():
+    dag = ComputationalDAG(precomputed_nodes=["a"])
+    dag.add_node("b", ["a", "x"])
+    dag.add_node("c", ["b"])
+    assert _run(dag) == []
+    assert dag.undone_count == 3
+
+    dag.add_precomputed_nodes(["x"])
+    assert _run(dag) == ["b", "c"]
+
+
+def test_dependency_added_to_ready_node():
+    dag = ComputationalDAG()
+    dag.add_node("a")
+    dag.add_node("a", ["b"])
+    assert _run(dag) == []
+    dag.add_node("b")
+    assert _run(dag) == ["b", "a"]
+
+
+def test_node_status_error():
+    dag = ComputationalDAG(precomputed_nodes=["a"])
+    with pytest.raises(NodeStatusError):
+        dag.add_node("a", ["b"])
+
+
+def test_check_cycles():
+    dag = ComputationalDAG(precomputed_nodes=["a"])
+    dag.add_node("b", ["a", "c"])
+    dag.add_node("c", ["b"])
+    assert _run(dag) == []
+    with pytest.raises(CycleError):
+        dag.check_cycles()
+
+    dag = ComputationalDAG(precomputed_nodes=["a"])
+    dag.add_node("b", ["a"])
+    dag.check_cycles()
+
+
+def test_deep_chain():
+    n = 50000
+    dag = ComputationalDAG(precomputed_nodes=[0])
+    for i in range(1, n):
+        dag.add_node(i, [i - 1])
+    dag.check_cycles()
+    assert len(dag) == n
+    assert _run(dag) == list(range(1, n))
+
+
+def test_interned_store():
+    dag = ComputationalDAG(precomputed_nodes=["a"])
+    dag.add_node("b", ["a", "a", "x"])
+    assert "x" in dag and "y" not in dag
+    assert dag.get_status("a") == NodeStatus.DONE
+    assert dag.get_status("b") == NodeStatus.PENDING
+    assert dag.undone_count == 2
+    dag.add_node("x")
+    dag.add_node("b", ["x"])
+    assert _run(dag) == ["x", "b"]
+
+
+def _square(x):
+    return x * x
+
+
+@pytest.mark.parametrize("min_level", [1, 100])
+def test_run_parallel(monkeypatch, min_level):
+    monkeypatch.setattr(computational_dag, "PARALLEL_MIN_LEVEL", min_level)
+    n = 40
+    dag = ComputationalDAG(precomputed_nodes=[0])
+    for i in range(1, n):
+        dag.add_node(i, [i // 2])
+    values = {0: 1}
+    with ThreadPoolExecutor(3) as executor:
+        run_parallel(
+            dag,
+            lambda i: partial(_square, values[i // 2] + 1),
+            values.__setitem__,
+            executor,
+            3,
+        )
+    assert dag.undone_count == 0
+    for i in range(1, n):
+        assert values[i] == (values[i // 2] + 1) ** 2
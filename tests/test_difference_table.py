@@ -0,0 +1,110 @@
+from fractions import Fraction
+
+import pytest
+
+import difference_table
+from difference_table import (build_difference_table, continue_sequence,
+                              iter_difference_rows,
+                              make_newton_polynomial, newton_coefficients)
+from table import empty
+
+
+@pytest.mark.parametrize(
+    "sequence,rows",
+    [
+        ([], []),
+        ([0, 0, 0], []),
+        ([5, 5, 5], [[5, 5, 5]]),
+        ([1, 4, 9, 16], [[1, 4, 9, 16], [3, 5, 7], [2, 2]]),
+        ([1, 2, 4, 8], [[1, 2, 4, 8], [1, 2, 4], [1, 2], [1]]),
+    ],
+)
+def test_iter_difference_rows(sequence, rows):
+    assert list(iter_difference_rows(iter(sequence))) == rows
+
+
+@pytest.mark.parametrize(
+    "sequence,coefficients",
+    [
+        ([i**2 for i in range(1, 10)], [1, 3, 2]),
+        ([i**3 - 2 * i for i in range(1000)], [0, -1, 6, 6]),
+        ([Fraction(1, i) for i in range(1, 4)], [1, Fraction(-1, 2), Fraction(1, 3)]),
+    ],
+)
+def test_newton_coefficients(sequence, coefficients):
+    assert newton_coefficients(sequence) == coefficients
+
+
+@pytest.mark.parametrize("basis", ["monomial", "newton", "sum"])
+def test_make_newton_polynomial(basis):
+    sequence = [i**3 - 2 * i for i in range(6)]
+    newton = make_newton_polynomial(newton_coefficients(sequence), basis)
+    assert [newton(i) for i in range(10)] == [i**3 - 2 * i for i in range(10)]
+
+
+def test_make_newton_polynomial_bases_agree():
+    differences = [3, -1, 4, 1, Fraction(-5, 2), 9]
+    polynomial = make_newton_polynomial(differences, "sum")
+    assert make_newton_polynomial(differences) == polynomial
+    assert make_newton_polynomial(differences, "newton").to_polynomial() == polynomial
+    with pytest.raises(ValueError):
+        make_newton_polynomial(differences, "lagrange")
+
+
+def test_build_difference_table():
+    DT = build_difference_table([1, 4, 9, 16, 25])
+    assert DT.rows == 3
+    assert DT.get_col(0) == [1, 3, 2]
+    assert DT.get_row(2) == [2, 2, 2, empty, empty]
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+@pytest.mark.parametrize(
+    "sequence",
+    [
+        [i**3 - 2 * i for i in range(50)],
+        [3**i for i in range(40)],
+        # differences leave int64 and are continued with Python ints
+        [(-1) ** i * 2**61 for i in range(6)],
+        [(-2) ** i for i in range(70)],
+    ],
+)
+def test_numpy_difference_rows(sequence, use_numpy):
+    expected = []
+    row = sequence
+    while any(row):
+        expected.append(row)
+        row = [b - a for a, b in zip(row, row[1:])]
+    rows = list(iter_difference_rows(sequence, use_numpy=use_numpy))
+    assert rows == expected
+    assert all(type(value) is int for row in rows for value in row)
+    assert newton_coefficients(sequence, use_numpy=use_numpy) == [
+        row[0] for row in expected
+    ]
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+@pytest.mark.parametrize(
+    "sequence,count,expected",
+    [
+        ([i**2 for i in range(1, 10)], 5, [100, 121, 144, 169, 196]),
+        ([7, 7], 3, [7, 7, 7]),
+        ([0, 0, 0], 2, [0, 0]),
+        ([1, 3, 6, 10], 2, [15, 21]),
+        ([2**62 * i**2 for i in range(4)], 1, [2**62 * 16]),
+    ],
+)
+def test_continue_sequence(sequence, count, expected, use_numpy):
+    assert continue_sequence(sequence, count, use_numpy=use_numpy) == expected
+
+
+def test_continue_sequence_fractions():
+    sequence = [Fraction(i**2, 3) for i in range(4)]
+    assert continue_sequence(sequence, 2) == [Fraction(16, 3), Fraction(25, 3)]
+
+
+def test_use_numpy_without_numpy(monkeypatch):
+    monkeypatch.setattr(difference_table, "np", None)
+    with pytest.raises(ImportError):
+        newton_coefficients([1, 4, 9], use_numpy=True)
+    assert newton_coefficients([1, 4, 9]) == [1, 3, 2]
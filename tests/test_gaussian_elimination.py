@@ -0,0 +1,120 @@
+from fractions import Fraction
+
+import pytest
+
+import gaussian_elimination as ge
+from functions.polynomial import Polynomial
+
+
+@pytest.mark.parametrize(
+    "M,det",
+    [
+        ([[2]], 2),
+        ([[1, 2], [3, 4]], -2),
+        ([[0, 1, 2], [1, 0, 3], [4, -3, 8]], -2),
+        ([[1, 2, 3], [2, 4, 6], [1, 0, 1]], 0),
+        ([[0, 0], [0, 0]], 0),
+    ],
+)
+def test_bareiss_determinant(M, det):
+    _, determinant = ge.bareiss(M)
+    assert determinant == det
+    _, determinant = ge.bareiss(M, jordan=True)
+    assert determinant == det
+
+
+def test_bareiss_polynomial():
+    x = Polynomial(0, 1)
+    M = [
+        [x + 1, Polynomial(2), x],
+        [Polynomial(1), x, Polynomial(0)],
+        [x * x, Polynomial(1), Polynomial(3)],
+    ]
+    _, determinant = ge.bareiss(M)
+    assert determinant == Polynomial(-6, 4, 3, 0, -1)
+
+
+@pytest.mark.parametrize(
+    "M,reduced",
+    [
+        (
+            [[Fraction(1, 2), 1, 2], [Fraction(1, 3), Fraction(-1, 4), 1]],
+            [[1, 0, Fraction(36, 11)], [0, 1, Fraction(4, 11)]],
+        ),
+        (
+            [[0, 2, 4, 2], [0, 1, 2, 3], [1, 1, 1, 1]],
+            [[1, 0, -1, 0], [0, 1, 2, 0], [0, 0, 0, 1]],
+        ),
+    ],
+)
+def test_fraction_free_jordan(M, reduced):
+    assert ge.gaussian_elimination(M, jordan=True, fraction_free=True) == reduced
+
+
+@pytest.mark.parametrize("jordan", [False, True])
+def test_fraction_free_matches_division(jordan):
+    M = [
+        [Fraction(a) for a in row]
+        for row in [
+            ["1/2", 3, "-2/3", 1],
+            ["5/6", "1/3", 0, 2],
+            [1, 6, "-4/3", 2],
+            [0, 0, "7/2", "-1/5"],
+        ]
+    ]
+    echelon = ge.gaussian_elimination(M, jordan=jordan)
+    assert ge.gaussian_elimination(M, jordan=jordan, fraction_free=True) == echelon
+
+
+def test_pivot_by_absolute_value():
+    M = [[0, 1, 1], [Fraction(-2), 1, 0]]
+    reduced = [[1, 0, Fraction(1, 2)], [0, 1, 1]]
+    assert ge.gaussian_elimination(M, jordan=True) == reduced
+    assert ge.gaussian_elimination(M, jordan=True, fraction_free=True) == reduced
+
+
+@pytest.mark.parametrize("n", [3, ge.NUMPY_THRESHOLD + 5])
+def test_float(n):
+    M = [
+        [float((i * j) % 7 - 3 + (i == j) * 10) for j in range(n + 1)] for i in range(n)
+    ]
+    A = ge.gaussian_elimination(M, jordan=True)
+    assert len(A) == n and all(len(row) == n + 1 for row in A)
+    x = [row[-1] for row in A]
+    for row in M:
+        assert sum(a * b for a, b in zip(row, x)) == pytest.approx(row[-1])
+    exact = ge.gaussian_elimination(M, jordan=True, fraction_free=True)
+    assert [row[-1] for row in exact] == pytest.approx(x)
+
+
+def test_inplace():
+    M = [[Fraction(2), 1, 4], [Fraction(1), 3, 5]]
+    copied = [list(row) for row in M]
+    reduced = [[1, 0, Fraction(7, 5)], [0, 1, Fraction(6, 5)]]
+    assert ge.gaussian_elimination(M, jordan=True) == reduced
+    assert M == copied
+    assert ge.gaussian_elimination(M, jordan=True, inplace=True) is M
+    assert M == reduced
+
+
+@pytest.mark.parametrize(
+    "A",
+    [
+        [[2, 1], [1, 3]],
+        [[0, 1, 2], [1, 0, 3], [4, -3, 8]],
+        [[Fraction(1, 2), Fraction(-1, 3)], [5, Fraction(7, 4)]],
+    ],
+)
+def test_lu(A):
+    n = len(A)
+    B = [[k - i, i * k + 1] for i, k in enumerate(range(1, n + 1))]
+    X = ge.LU(A).solve(B)
+    assert [
+        [sum(A[i][k] * X[k][j] for k in range(n)) for j in range(2)] for i in range(n)
+    ] == B
+    assert ge.LU(A).solve_vector([row[1] for row in B]) == [row[1] for row in X]
+
+
+def test_lu_singular():
+    with pytest.raises(ZeroDivisionError):
+        ge.LU([[1, 2], [2, 4]])
@@ -0,0 +1,51 @@
+import itertools
+from fractions import Fraction
+
+import pytest
+
+from functions import gcd
+from modular_solver import solve_mod_p, solve_modular, np
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+@pytest.mark.parametrize(
+    "A,x",
+    [
+        ([[2]], [Fraction(3, 2)]),
+        ([[0, 1], [1, 0]], [5, -7]),
+        (
+            [[Fraction(1, 2), 1, 2], [Fraction(1, 3), Fraction(-1, 4), 1], [1, 1, 1]],
+            [Fraction(-1, 7), Fraction(5, 3), 2],
+        ),
+        (
+            [[10**20, 1, 2], [3, 10**19, 5], [7, 11, -(10**18)]],
+            [Fraction(1, 10**15), 2, Fraction(-3, 4)],
+        ),
+    ],
+)
+def test_solve_modular(A, x, use_numpy):
+    if use_numpy and np is None:
+        pytest.skip("NumPy is not installed")
+    b = [sum(a * x_j for a, x_j in zip(row, x)) for row in A]
+    assert solve_modular(A, b, use_numpy=use_numpy) == x
+
+
+def test_solve_mod_p():
+    p = 101
+    x = solve_mod_p([[3, 1], [4, 2]], [5, 6], p)
+    assert [(3 * x[0] + x[1]) % p, (4 * x[0] + 2 * x[1]) % p] == [5, 6]
+    assert solve_mod_p([[1, 2], [2, 4]], [1, 1], p) is None
+
+
+def test_singular():
+    with pytest.raises(ZeroDivisionError):
+        solve_modular([[1, 2], [2, 4]], [1, 2])
+
+
+def test_interleaved_prime_iterators(monkeypatch):
+    monkeypatch.setattr(gcd, "_primes", [])
+    first, second = gcd.iter_primes(), gcd.iter_primes()
+    primes = [next(first), next(second), next(second), next(first), next(first)]
+    assert primes[:3] == [2147483647, 2147483647, 2147483629]
+    assert gcd._primes == sorted(set(gcd._primes), reverse=True)
+    assert list(itertools.islice(gcd.iter_primes(), 3)) == gcd._primes
@@ -0,0 +1,73 @@
+from fractions import Fraction
+from math import factorial
+
+import pytest
+
+from functions.newton import NewtonPolynomial, newton_to_monomial
+from functions.polynomial import Polynomial
+
+
+def _falling_sum(integers, x):
+    res, product = 0, 1
+    for i, c in enumerate(integers):
+        res += c * product
+        product *= x - i
+    return res
+
+
+@pytest.mark.parametrize(
+    "integers",
+    [[], [5], [1, 1], [0, 0, 1], [3, -1, 4, 1, -5, 9, 2, -6], list(range(1, 20))],
+)
+def test_newton_to_monomial(integers):
+    monomial = newton_to_monomial(integers)
+    assert len(monomial) == max(len(integers), 1)
+    for x in range(-3, 10):
+        assert sum(c * x**k for k, c in enumerate(monomial)) == _falling_sum(
+            integers, x
+        )
+
+
+@pytest.mark.parametrize(
+    "differences,polynomial",
+    [
+        ([], Polynomial()),
+        ([7], Polynomial(7)),
+        ([1, 3, 2], Polynomial(1, 2, 1)),
+        ([0, 1], Polynomial(0, 1)),
+        ([0, 0, 1, 0], Polynomial(0, Fraction(-1, 2), Fraction(1, 2))),
+        (
+            [Fraction(1, 2), 0, 3],
+            Polynomial(Fraction(1, 2), Fraction(-3, 2), Fraction(3, 2)),
+        ),
+    ],
+)
+def test_to_polynomial(differences, polynomial):
+    assert NewtonPolynomial(differences).to_polynomial() == polynomial
+
+
+@pytest.mark.parametrize("x", [-7, -1, 0, 1, 2, 5, 40, Fraction(1, 3)])
+def test_newton_polynomial_call(x):
+    differences = [2, -1, 6, 0, 3, -4]
+    expected = sum(
+        d * Fraction(_falling_sum([0] * i + [1], x), factorial(i))
+        for i, d in enumerate(differences)
+    )
+    value = NewtonPolynomial(differences)(x)
+    assert value == expected
+    if isinstance(x, int):
+        assert type(value) is int
+
+
+def test_newton_polynomial_call_float():
+    assert NewtonPolynomial([1, 1, 2])(2.5) == pytest.approx(1 + 2.5 + 2.5 * 1.5)
+
+
+def test_newton_polynomial_matches_monomial():
+    differences = [3, -1, 4, 1, -5, 9, 2, -6]
+    newton = NewtonPolynomial(differences)
+    polynomial = newton.to_polynomial()
+    points = list(range(-20, 20))
+    assert newton.evaluate_many(points) == polynomial.evaluate_many(points)
+    assert newton.degree == 7
+    assert NewtonPolynomial([1, 2, 0, 0]) == NewtonPolynomial([1, 2])
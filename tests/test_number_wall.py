@@ -0,0 +1,146 @@
+import pickle
+from collections import OrderedDict
+from fractions import Fraction
+
+import pytest
+
+import computational_dag
+import number_wall.number_wall
+from functions.polynomial import FrozenPolynomial
+from number_wall.checkpoint import (LENGTH, MAGIC, CheckpointError,
+                                    CheckpointWriter, read_checkpoint)
+from number_wall.number_wall import NumberWall
+from table import Cell, empty
+
+SEQUENCES = [
+    [1, 1, 2, 4, 7, 13, 24, 44, 81, 149, 274, 504, 927, 1705],
+    [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8, 9, 7, 9, 3],
+    # zero windows and single zeros
+    [1, 0, 0, -1, 1, 1, 0, 1, 0, -1, 0, -1, 0, 0, 0, 0, -1, 0, -1, 2, -1, 0, 0],
+    [2, 1, 0, 0, 0, 3, 1, 4, 1, 5, 0, 2, 6, 5, 3, 5],
+]
+
+
+def _build(sequence, fast):
+    wall = NumberWall([Fraction(s) for s in sequence])
+    wall.build(fast=fast)
+    return wall
+
+
+@pytest.mark.parametrize("sequence", SEQUENCES)
+def test_fast_build_matches_rules(sequence):
+    slow = _build(sequence, fast=False)
+    fast = _build(sequence, fast=True)
+    assert fast.rows == slow.rows
+    for i in range(slow.rows):
+        assert fast.table.get_row(i) == slow.table.get_row(i)
+
+
+def test_fast_build_skips_rules():
+    wall = _build(SEQUENCES[1], fast=True)
+    assert not wall.rules
+    assert wall.table[Cell(3, 1)] == 1 * 1 - 3 * 4
+    assert wall.table[Cell(3, 0)] is empty
+
+
+def test_linear_recurrence():
+    wall = _build(SEQUENCES[0], fast=True)
+    assert wall.rows == 5
+    assert wall.get_constant_element() in (-1, 1)
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_parallel_build(monkeypatch, fast):
+    monkeypatch.setattr(computational_dag, "PARALLEL_MIN_LEVEL", 1)
+    monkeypatch.setattr(number_wall.number_wall, "PARALLEL_MIN_ROW", 1)
+    sequence = [Fraction(s) for s in SEQUENCES[2]]
+    serial = NumberWall(sequence)
+    serial.build(fast=fast)
+    parallel = NumberWall(sequence)
+    parallel.build(fast=fast, workers=2)
+    assert str(parallel.table) == str(serial.table)
+
+
+def _record_ends(data):
+    ends, position = [], len(MAGIC)
+    while position < len(data):
+        position += LENGTH.size + LENGTH.unpack(data[position : position + 4])[0]
+        ends.append(position)
+    return ends
+
+
+@pytest.mark.parametrize("fast", [True, False])
+@pytest.mark.parametrize("sequence", SEQUENCES[1:])
+def test_resume(tmp_path, sequence, fast):
+    path = str(tmp_path / "wall.bin")
+    sequence = [Fraction(s) for s in sequence]
+    wall = NumberWall(sequence)
+    wall.build(fast=fast, checkpoint=path)
+    with open(path, "rb") as fi:
+        data = fi.read()
+
+    checkpoint = read_checkpoint(path)
+    assert checkpoint.sequence == sequence
+    assert checkpoint.size == len(data)
+
+    ends = _record_ends(data)
+    # cut after every record and inside the last one
+    for cut in ends + [end + 3 for end in ends[:-1]]:
+        with open(path, "wb") as fo:
+            fo.write(data[:cut])
+        resumed = NumberWall.resume(path, fast=fast)
+        assert str(resumed.table) == str(wall.table)
+        with open(path, "rb") as fi:
+            assert fi.read() == data
+
+
+def test_checkpoint_error(tmp_path):
+    path = tmp_path / "wall.bin"
+    path.write_bytes(b"not a checkpoint")
+    with pytest.raises(CheckpointError):
+        NumberWall.resume(str(path))
+    path.write_bytes(MAGIC)
+    with pytest.raises(CheckpointError):
+        NumberWall.resume(str(path))
+
+
+def test_resume_truncated(tmp_path):
+    path = str(tmp_path / "wall.bin")
+    sequence = [Fraction(s) for s in SEQUENCES[2]]
+    wall = NumberWall(sequence)
+    wall.build(checkpoint=path)
+    with open(path, "rb") as fi:
+        data = fi.read()
+
+    ends = _record_ends(data)
+    # a crash in the middle of writing the payload of the fourth record
+    with open(path, "wb") as fo:
+        fo.write(data[: ends[3] - 5])
+    checkpoint = read_checkpoint(path)
+    assert checkpoint.size == ends[2]
+    assert sorted(checkpoint.rows) == [3, 4]
+    resumed = NumberWall.resume(path)
+    assert str(resumed.table) == str(wall.table)
+
+
+def test_checkpoint_rejects_other_classes(tmp_path):
+    path = tmp_path / "wall.bin"
+    payload = pickle.dumps(OrderedDict())
+    path.write_bytes(MAGIC + LENGTH.pack(len(payload)) + payload)
+    with pytest.raises(CheckpointError):
+        read_checkpoint(str(path))
+
+
+def test_checkpoint_frozen_values(tmp_path):
+    path = str(tmp_path / "wall.bin")
+    sequence = [FrozenPolynomial(1, 2), FrozenPolynomial(Fraction(1, 3), 2**70)]
+    CheckpointWriter(path, sequence).close()
+    assert read_checkpoint(path).sequence == sequence
+
+
+def test_checkpoint_corrupt_record(tmp_path):
+    path = tmp_path / "wall.bin"
+    payload = b"\x80\x05not a pickle"
+    path.write_bytes(MAGIC + LENGTH.pack(len(payload)) + payload)
+    with pytest.raises(CheckpointError):
+        read_checkpoint(str(path))
@@ -0,0 +1,79 @@
+import math
+from fractions import Fraction
+
+import pytest
+
+from functions.polynomial import Polynomial
+from functions.rational import Rational
+from pade_approximant import (pade_antidiagonal, pade_approximant,
+                              pade_rational, pade_table)
+
+EXP = [Fraction(1, math.factorial(k)) for k in range(12)]
+
+
+def test_pade_rational():
+    R = pade_rational(EXP, 2, 2)
+    assert R.numerator == Polynomial(1, Fraction(1, 2), Fraction(1, 12))
+    assert R.denominator == Polynomial(1, Fraction(-1, 2), Fraction(1, 12))
+
+
+def test_pade_rational_is_reduced():
+    for R in pade_antidiagonal([Fraction(2, k + 3) for k in range(8)], 7):
+        cancelled = Rational(R.numerator, R.denominator)
+        assert R._cancelled
+        assert (R.numerator, R.denominator) == (
+            cancelled.numerator,
+            cancelled.denominator,
+        )
+
+
+@pytest.mark.parametrize("num_degree,denom_degree", [(3, 1), (1, 4), (5, 5)])
+def test_pade_rational_gaussian(num_degree, denom_degree):
+    P, Q = pade_approximant(EXP, num_degree, denom_degree)
+    assert pade_rational(EXP, num_degree, denom_degree) == Rational(
+        Polynomial(*P), Polynomial(*Q)
+    )
+
+
+@pytest.mark.parametrize(
+    "T,num_degree,denom_degree",
+    [
+        (EXP, 2, 2),
+        (EXP, 4, 7),
+        ([Fraction(1, k + 1) * (-1) ** k for k in range(9)], 3, 5),
+        ([1, 0, 1, 2, 0, 3], 1, 3),  # singular leading minor
+        ([1, 0, 0, 0, 1], 1, 2),  # singular system
+    ],
+)
+def test_pade_approximant_methods(T, num_degree, denom_degree):
+    expected = pade_approximant(T, num_degree, denom_degree, method="gaussian")
+    assert pade_approximant(T, num_degree, denom_degree) == expected
+    assert pade_approximant(T, num_degree, denom_degree, method="modular") == expected
+    assert pade_approximant(T, num_degree, denom_degree, method="lu") == expected
+
+
+def test_pade_antidiagonal():
+    T = [Fraction(1, k + 1) * (-1) ** k for k in range(7)]  # log(1 + x) / x
+    for M, R in enumerate(pade_antidiagonal(T, 6)):
+        assert R.degree[0] <= 6 - M and R.degree[1] <= M
+        error = R.numerator - R.denominator * Polynomial(*T)
+        assert all(c == 0 for c in error.coefficients[:7])
+    assert pade_antidiagonal(T, 6)[0].numerator == Polynomial(*T)
+
+
+def test_pade_table():
+    table = pade_table(EXP, 4, 3)
+    assert len(table) == 5 and all(len(row) == 4 for row in table)
+    assert table[2][2] == pade_rational(EXP, 2, 2)
+    assert table[0][3] == pade_rational(EXP, 0, 3)
+    T = [1, 0, 1, 2, 0, 3, -1, 4]
+    table = pade_table(T, 2, 5)
+    assert len(table) == 3 and all(len(row) == 6 for row in table)
+    for L, row in enumerate(table):
+        for M, R in enumerate(row):
+            assert R == pade_rational(T, L, M)
+
+
+def test_degenerate():
+    # [0/1] of 2x does not exist, the reduced Padé form is 0
+    assert pade_rational([0, 2], 0, 1) == 0
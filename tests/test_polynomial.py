@@ -2,7 +2,11 @@ from fractions import Fraction
 
 import pytest
 
-from functions.polynomial import Polynomial
+from functions.composition import compose_integers, taylor_shift
+from functions.division import divmod_integer, series_inverse
+from functions.multiplication import (mul_karatsuba, mul_kronecker,
+                                     mul_schoolbook, multiply)
+from functions.polynomial import FrozenPolynomial, Polynomial
 
 
 def test_create():
@@ -128,16 +132,218 @@ def test_to_integer(A, coeffs):
     assert all(isinstance(coeff, int) for coeff in B.coefficients)
 
 
+@pytest.mark.parametrize("method", [None, "euclid", "subresultant", "modular"])
 @pytest.mark.parametrize(
     "A,B,coeffs",
     [
         (Polynomial(1, 2, 1), Polynomial(-1, 0, 1), [1, 1]),
+        (Polynomial(1, 2, 1), Polynomial(3), [1]),
+        (Polynomial(1, 0, 1), Polynomial(1, 1), [1]),
+        (
+            Polynomial(Fraction(1, 2), 3) * Polynomial(*range(1, 15)),
+            Polynomial(-7, 0, 2) * Polynomial(*range(1, 15)),
+            [Fraction(k, 14) for k in range(1, 15)],
+        ),
+        # untruncated zero leading coefficients
+        (Polynomial(1, 2, 1, 0), Polynomial(-1, 0, 1, 0, 0), [1, 1]),
+        (Polynomial(*range(1, 40), 0), Polynomial(*range(2, 41)), [1]),
     ],
 )
-def test_gcd(A, B, coeffs):
-    C = A.gcd(B)
+def test_gcd(A, B, coeffs, method):
+    C = A.gcd(B, method)
     assert C.coefficients == coeffs
 
 
+def test_pow_zero_constant_term():
+    assert (Polynomial(0, 0, 1, 2) ** 3).coefficients == [0] * 6 + [1, 6, 12, 8]
+
+
 def test_eq_zero():
     assert Polynomial(0) == 0
+
+
+@pytest.mark.parametrize(
+    "a,b",
+    [
+        ([1, -2, 3] * 20, [5, 0, -7, 11] * 15),
+        ([Fraction(1, k) for k in range(1, 40)], [Fraction(-k, 7) for k in range(30)]),
+        ([Fraction(k, 3) for k in range(50)], list(range(-10, 10))),
+    ],
+)
+def test_mul_algorithms(a, b):
+    expected = mul_schoolbook(a, b)
+    assert mul_karatsuba(a, b) == expected
+    assert multiply(a, b) == expected
+    assert (Polynomial(*a) * Polynomial(*b)).coefficients == expected
+
+
+def test_mul_kronecker():
+    a = [10**30, -1, 0, 7, -(10**12)] * 5
+    b = [-3, 2**70, 1] * 4
+    assert mul_kronecker(a, b) == mul_schoolbook(a, b)
+
+
+def test_series_inverse():
+    f = [1, -1]
+    assert series_inverse(f, 6) == [1] * 6
+    f = [Fraction(2), 3, Fraction(-1, 5), 7]
+    g = series_inverse(f, 10)
+    assert multiply(f, g)[:10] == [1] + [0] * 9
+
+
+def test_divmod():
+    A = Polynomial(*[Fraction(k * k - 7, k + 1) for k in range(90)])
+    B = Polynomial(*[3 - k for k in range(40)])
+    Q, R = divmod(A, B)
+    assert R.degree < B.degree
+    assert Q * B + R == A
+
+
+@pytest.mark.parametrize(
+    "a,b",
+    [
+        ([k * k - 7 for k in range(90)], [3 - k for k in range(40)]),
+        ([5, -1, 0, 2, 9, 4], [2, 3, 1]),
+        ([1, 2, 3], [6]),
+    ],
+)
+def test_divmod_integer(a, b):
+    q, r, d = divmod_integer(a, b)
+    assert Polynomial(*q) * Polynomial(*b) + Polynomial(*r) == Polynomial(*a) * d
+
+
+@pytest.mark.parametrize(
+    "A,content,integers",
+    [
+        (Polynomial(2, 4, 6), 2, [1, 2, 3]),
+        (Polynomial(Fraction(2, 3), Fraction(5, 6)), Fraction(1, 6), [4, 5]),
+        (Polynomial(0), 1, [0]),
+        (-Polynomial(Fraction(1, 2), 1), Fraction(-1, 2), [1, 2]),
+    ],
+)
+def test_primitive(A, content, integers):
+    assert A.primitive() == (content, integers)
+
+
+def test_call():
+    A = Polynomial(Fraction(1, 2), -3, Fraction(2, 3))
+    assert A(3) == Fraction(1, 2) - 9 + 6
+    assert A(Fraction(-1, 2)) == Fraction(1, 2) + Fraction(3, 2) + Fraction(1, 6)
+    assert A(0.5) == pytest.approx(0.5 - 1.5 + 1 / 6)
+    assert isinstance(Polynomial(1, 2)(3), int)
+
+
+@pytest.mark.parametrize("method", ["horner", "tree"])
+def test_evaluate_many(method):
+    A = Polynomial(Fraction(1, 2), -3, Fraction(2, 3), 0, 5, -7)
+    points = [0, 3, -2, Fraction(-1, 2), Fraction(5, 3), 3]
+    assert A.evaluate_many(points, method) == [A(x) for x in points]
+    assert Polynomial(4).evaluate_many(points, method) == [4] * len(points)
+    assert A.evaluate_many([], method) == []
+
+
+def test_evaluate_many_numpy():
+    np = pytest.importorskip("numpy")
+    A = Polynomial(1, -3, 0, 2)
+    x = np.array([0.5, -1.5, 2.0])
+    assert A.evaluate_many(x) == pytest.approx([A(float(v)) for v in x])
+
+    n = np.array([-4, 0, 7], dtype=np.int64)
+    res = A.evaluate_many(n)
+    assert res.dtype == np.int64 and res.tolist() == [A(int(v)) for v in n]
+
+    big = np.array([10**7, -(10**7)], dtype=np.int64)
+    res = A.evaluate_many(big)
+    assert res.dtype == object and res.tolist() == [A(int(v)) for v in big]
+
+
+def test_evaluate_progression():
+    A = Polynomial(Fraction(1, 2), -3, Fraction(2, 3), 0, 5)
+    assert A.evaluate_progression(-3, Fraction(1, 2), 20) == [
+        A(-3 + Fraction(k, 2)) for k in range(20)
+    ]
+    assert A.evaluate_progression(1, 1, 2) == [A(1), A(2)]
+    assert Polynomial(7).evaluate_progression(0, 1, 3) == [7, 7, 7]
+
+
+def _horner(A, B):
+    res = Polynomial(0)
+    for coefficient in reversed(A.coefficients):
+        res = res * B + coefficient
+    return res
+
+
+@pytest.mark.parametrize("a", [0, 3, -2, Fraction(-5, 3), Fraction(1, 7)])
+def test_shift(a):
+    A = Polynomial(Fraction(1, 2), -3, Fraction(2, 3), 0, 5, -7)
+    assert A.shift(a) == _horner(A, Polynomial(a, 1))
+    assert Polynomial(4).shift(a) == 4
+
+
+def test_taylor_shift_long():
+    p = [(-1) ** k * (k * k + 3) for k in range(70)]
+    for a in (5, -1):
+        shifted = Polynomial(*taylor_shift(p, a))
+        expected = [Polynomial(*p)(x + a) for x in range(3)]
+        assert [shifted(x) for x in range(3)] == expected
+
+
+@pytest.mark.parametrize(
+    "A,B",
+    [
+        (Polynomial(1, 2, 3), Polynomial(Fraction(1, 2), 1)),
+        (Polynomial(*range(-8, 12)), Polynomial(Fraction(-2, 3), 0, 5, Fraction(1, 4))),
+        (Polynomial(Fraction(3, 5)), Polynomial(1, 1)),
+        (Polynomial(1, 1, 1), Polynomial(7)),
+    ],
+)
+def test_compose(A, B):
+    C = _horner(A, B)._truncate()
+    assert A.compose(B).coefficients == C.coefficients
+    assert A(B) == C
+
+
+def test_compose_integers():
+    p, q = list(range(1, 40)), [2, -1, 3]
+    expected = _horner(Polynomial(*p), Polynomial(*q)).coefficients
+    assert compose_integers(p, q) == expected
+
+
+def test_frozen():
+    A = FrozenPolynomial(Fraction(1, 2), 3, -1)
+    B = Polynomial(Fraction(1, 2), 3, -1).freeze()
+    assert A == B and hash(A) == hash(B)
+    assert hash((-(-A)).freeze()) == hash(A)
+    assert hash(FrozenPolynomial(Fraction(4, 2))) == hash(2)
+    # untruncated values of opposite sign representation
+    C = FrozenPolynomial(Fraction(-4, 9), 0)
+    D = (-Polynomial(Fraction(4, 9), 0)).freeze()
+    assert C == D and hash(C) == hash(D)
+    assert A.coefficients == (Fraction(1, 2), 3, -1)
+    assert A.degree == 2
+    assert {A: 1}[B] == 1
+    assert not hasattr(A, "__dict__")
+
+    C = A * A
+    assert type(C) is Polynomial
+    assert C == Polynomial(Fraction(1, 4), 3, 8, -6, 1)
+
+    with pytest.raises(TypeError):
+        A.add_inplace(1)
+    with pytest.raises(TypeError):
+        hash(Polynomial(1))
+
+
+def test_frozen_storage():
+    assert FrozenPolynomial(1, 2, 3).primitive()[1].typecode == "q"
+    big = FrozenPolynomial(1, 2**70)
+    assert isinstance(big.primitive()[1], tuple)
+    assert big == Polynomial(1, 2**70)
+
+
+def test_inplace():
+    A = Polynomial(1, 2)
+    B = A
+    A.add_inplace(Polynomial(0, 1, 1)).mul_inplace(2).sub_inplace(2)
+    assert B is A
+    assert A.coefficients == [0, 6, 2]
@@ -0,0 +1,71 @@
+import math
+from fractions import Fraction
+
+import pytest
+
+from functions.polynomial import Polynomial
+from functions.power_series import PowerSeries
+
+
+def test_create():
+    S = PowerSeries(1, Fraction(1, 2), precision=4)
+    assert S.coefficients == [1, Fraction(1, 2), 0, 0]
+    assert PowerSeries(1, 2, 3, precision=2).coefficients == [1, 2]
+
+
+def test_mul():
+    A = PowerSeries(1, 2, 3, precision=4)
+    B = PowerSeries(1, -1, precision=3)
+    assert (A * B).coefficients == [1, 1, 1]
+    assert (A * Polynomial(0, 1)).coefficients == [0, 1, 2, 3]
+    assert (2 * B).coefficients == [2, -2, 0]
+
+
+def test_inverse():
+    A = PowerSeries(1, -1, precision=6)
+    assert A.inverse().coefficients == [1] * 6
+    B = PowerSeries(3, Fraction(1, 2), -7, 1, precision=10)
+    assert B * B.inverse() == PowerSeries(1, precision=10)
+    assert (1 / B) == B.inverse()
+
+
+def test_exp_log():
+    n = 10
+    E = PowerSeries(0, 1, precision=n).exp()
+    assert E.coefficients == [Fraction(1, math.factorial(k)) for k in range(n)]
+    L = PowerSeries(1, 1, precision=n).log()
+    assert L.coefficients == [0] + [Fraction((-1) ** (k + 1), k) for k in range(1, n)]
+    assert L.exp() == PowerSeries(1, 1, precision=n)
+    with pytest.raises(ValueError):
+        PowerSeries(2, 1, precision=n).log()
+    with pytest.raises(ValueError):
+        PowerSeries(1, 1, precision=n).exp()
+
+
+@pytest.mark.parametrize(
+    "A,power",
+    [
+        (PowerSeries(4, 3, Fraction(1, 2), 7, precision=12), Fraction(1, 2)),
+        (PowerSeries(8, 1, 2, precision=12), Fraction(-2, 3)),
+        (PowerSeries(1, 2, 3, precision=12), -3),
+    ],
+)
+def test_pow(A, power):
+    root = A ** Fraction(1, power.denominator)
+    assert root ** power.denominator == A
+    assert (A**power) * (A**-power) == PowerSeries(1, precision=12)
+
+
+def test_pow_integer():
+    P = Polynomial(4, 3, Fraction(1, 2), 7)
+    assert PowerSeries.from_polynomial(P, 10) ** 5 == PowerSeries.from_polynomial(
+        P**5, 10
+    )
+
+
+def test_sqrt():
+    A = PowerSeries(Fraction(9, 4), 3, Fraction(1, 2), 7, precision=12)
+    assert A.sqrt() * A.sqrt() == A
+    assert A.sqrt()[0] == Fraction(3, 2)
+    with pytest.raises(ValueError):
+        PowerSeries(2, 1, precision=4).sqrt()
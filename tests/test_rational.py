@@ -1,3 +1,4 @@
+import threading
 from fractions import Fraction
 
 import pytest
@@ -184,3 +185,50 @@ def test_to_integer(A, P_coeffs, Q_coeffs):
 def test_eq_zero():
     assert Rational(Polynomial(0), Polynomial(1, 1)) == 0
 
+
+def test_lazy_cancellation():
+    A = Rational(Polynomial(1, 2), Polynomial(1, 3))
+    B = Rational(Polynomial(1, -1), Polynomial(1, 3, 4))
+    expected = (A * B - A) / B
+
+    with Rational.lazy_cancellation():
+        C = (A * B - A) / B
+        assert C == expected
+        assert C.degree != expected.degree
+    assert not Rational.is_lazy()
+
+    C.normalize()
+    assert C.numerator.coefficients == expected.numerator.coefficients
+    assert C.denominator.coefficients == expected.denominator.coefficients
+
+
+def test_lazy_cancellation_threshold():
+    A = Rational(Polynomial(1, 1), Polynomial(1, 3))
+    with Rational.lazy_cancellation(max_degree=3):
+        B = A * A
+        assert B.degree == (2, 2)
+        C = B * A
+        assert C.degree == (3, 3)
+        D = C / A
+        assert D.degree == (2, 2)
+        assert D == 0 * A + B
+
+
+def test_lazy_cancellation_is_context_local():
+    seen = []
+    with Rational.lazy_cancellation(max_degree=3):
+        thread = threading.Thread(target=lambda: seen.append(Rational.is_lazy()))
+        thread.start()
+        thread.join()
+        with Rational.lazy_cancellation(max_bits=64):
+            A = Rational(Polynomial(1, 1), Polynomial(1, 3))
+            assert (A * A * A / A).degree == (2, 2)
+        assert Rational.is_lazy()
+    assert seen == [False]
+    assert not Rational.is_lazy()
+
+
+def test_untruncated_operands():
+    R = Rational(Polynomial(*range(1, 40), 0), Polynomial(*range(2, 41)))
+    assert R.denominator == Polynomial(*range(2, 41))
+    assert R.numerator(2) == Polynomial(*range(1, 40))(2)
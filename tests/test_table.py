@@ -0,0 +1,146 @@
+from fractions import Fraction
+
+import pytest
+
+from table import (Cell, FlatTable, Int64Table, NumpyTable, SparseTable, Table,
+                   TrapezoidTable, empty)
+
+STORAGES = ["list", "flat", "numpy", "int64", "sparse"]
+
+
+@pytest.mark.parametrize(
+    "storage, cls",
+    [
+        ("list", Table),
+        ("flat", FlatTable),
+        ("numpy", NumpyTable),
+        ("int64", Int64Table),
+        ("sparse", SparseTable),
+    ],
+)
+def test_storage_class(storage, cls):
+    assert type(Table(2, 3, storage=storage)) is cls
+
+
+def test_unknown_storage():
+    with pytest.raises(ValueError):
+        Table(2, 3, storage="dict")
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+def test_fill_and_access(storage):
+    T = Table(4, 3, lambda i, j, fn: i + j if i < 3 else empty, storage=storage)
+    assert T[1, 2] == 3
+    assert T[Cell(2, 1)] == 3
+    assert T[3, 0] == empty
+    assert T.get_row(1) == [1, 2, 3]
+    assert T.get_row(3) == [empty, empty, empty]
+    assert T.get_col(2) == [2, 3, 4, empty]
+
+    T[Cell(3, 1)] = 7
+    assert T[3, 1] == 7
+    assert T.get_row(3) == [empty, 7, empty]
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+def test_filler_reads_previous_cells(storage):
+    T = Table(
+        3, 4, lambda i, j, fn: 1 if i == 0 else fn((i - 1, j)) * 2, storage=storage
+    )
+    T.add_row(lambda i, j, fn: fn((i - 1, j)) + j)
+    assert T.rows == 4
+    assert T.get_col(3) == [1, 2, 4, 7]
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+def test_set_row_and_truncate(storage):
+    T = Table(4, 3, storage=storage)
+    T.set_row(0, [1, 2, 3])
+    T.set_row(1, [0, empty, 0])
+    T.set_row(2, [0, 0, 0])
+    assert T.get_row(1) == [0, empty, 0]
+    assert T.all_in_row(1, lambda x: x == 0)
+    assert not T.all_in_row(0, lambda x: x == 0)
+
+    T.truncate_zero_rows()
+    assert T.rows == 1
+    assert str(T) == "1 2 3"
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+def test_str(storage):
+    T = Table(
+        2, 2, lambda i, j, fn: 10 * i + j if i + j < 2 else empty, storage=storage
+    )
+    assert str(T) == " 0 1\n10  "
+
+
+@pytest.mark.parametrize("key", [(0, 3), (2, 0), (0, -1), (-1, 0), Cell(1, 3)])
+def test_flat_out_of_range(key):
+    T = Table(2, 3, lambda i, j, fn: 10 * i + j, storage="flat")
+    with pytest.raises(IndexError):
+        T[key]
+    with pytest.raises(IndexError):
+        T[key] = 1
+    with pytest.raises(IndexError):
+        T.set_row(2, [1, 2, 3])
+    assert T.get_row(1) == [10, 11, 12]
+
+
+@pytest.mark.parametrize("key", [(5, 9), (0, 3), (2, 0), (0, -1), Cell(-1, 0)])
+def test_sparse_out_of_range(key):
+    T = Table(2, 3, storage="sparse")
+    with pytest.raises(IndexError):
+        T[key]
+    with pytest.raises(IndexError):
+        T[key] = 1
+    with pytest.raises(IndexError):
+        T.get_row(2)
+    assert T.get_row(1) == [empty] * 3
+
+
+def test_positional_storage():
+    with pytest.raises(TypeError):
+        Table(2, 3, None, "flat")
+
+
+def test_int64_overflow():
+    T = Table(1, 1, storage="int64")
+    with pytest.raises(OverflowError):
+        T[0, 0] = 2**64
+    with pytest.raises(OverflowError):
+        T.set_row(0, [-(2**64)])
+    T[0, 0] = 2**62
+    assert type(T[0, 0]) is int
+
+
+def test_int64_rejects_non_integers():
+    T = Table(1, 2, storage="int64")
+    with pytest.raises(TypeError):
+        T[0, 0] = Fraction(7, 2)
+    with pytest.raises(TypeError):
+        T[0, 0] = 2.9
+    with pytest.raises(TypeError):
+        T.set_row(0, [1, 2.9])
+    assert T.get_row(0) == [empty, empty]
+
+
+def test_trapezoid_table():
+    T = TrapezoidTable(4, 5, lambda i: (i, 5 - i), lambda i, j, fn: 10 * i + j)
+    assert T.get_row(0) == [0, 1, 2, 3, 4]
+    assert T.get_row(1) == [empty, 11, 12, 13, empty]
+    assert T.get_row(3) == [empty] * 5
+    assert T[1, 0] == empty
+    assert T[1, -1] == empty
+    assert T.get_col(2) == [2, 12, 22, empty]
+
+    with pytest.raises(IndexError):
+        T[1, 4] = 1
+    T[1, 4] = empty
+
+    T.add_row()
+    assert T.rows == 5
+    assert T.get_row(4) == [empty] * 5
+    T.truncate_zero_rows()
+    assert T.rows == 3
+    assert str(T) == "0  1  2  3 4\n  11 12 13  \n     22     "
@@ -0,0 +1,37 @@
+from fractions import Fraction
+
+import pytest
+
+from toeplitz import levinson
+
+
+def _toeplitz(first_column, first_row):
+    n = len(first_column)
+    return [
+        [first_column[i - j] if i >= j else first_row[j - i] for j in range(n)]
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize(
+    "first_column,first_row,y",
+    [
+        ([2], [2], [3]),
+        ([4, 1, -2], [4, Fraction(1, 2), 3], [1, 0, -1]),
+        ([1, 2, 3, 4, 5], [1, -1, 2, -2, 3], [5, 4, 3, 2, 1]),
+    ],
+)
+def test_levinson(first_column, first_row, y):
+    x = levinson(first_column, first_row, y)
+    M = _toeplitz(first_column, first_row)
+    assert [sum(a * b for a, b in zip(row, x)) for row in M] == y
+
+
+def test_levinson_float():
+    x = levinson([4.0, 1.0], [4.0, 2.0], [1.0, 2.0])
+    assert x == pytest.approx([0.0, 0.5])
+
+
+def test_levinson_singular_minor():
+    with pytest.raises(ZeroDivisionError):
+        levinson([0, 1], [0, 1], [1, 1])
@@ -0,0 +1,54 @@
+from fractions import Fraction
+from typing import Sequence, TypeVar
+
+T = TypeVar("T", int, float, Fraction)
+
+
+def levinson(
+    first_column: Sequence[T], first_row: Sequence[T], y: Sequence[T]
+) -> list[T]:
+    """Solve M x = y for a Toeplitz matrix M in O(n^2) operations.
+
+    M[i][j] = first_column[i - j] for i >= j and first_row[j - i] otherwise,
+    the matrix itself is never built. Levinson recursion with forward and
+    backward vectors, it needs all leading principal minors of M to be
+    non-singular and raises ZeroDivisionError otherwise.
+    """
+
+    def t(k: int) -> T:
+        return first_column[k] if k >= 0 else first_row[-k]
+
+    n = len(y)
+    if n == 0:
+        return []
+    if t(0) == 0:
+        raise ZeroDivisionError("Singular leading minor")
+    inverse = 1 / t(0) if isinstance(t(0), float) else Fraction(1) / t(0)
+    forward = [inverse]
+    backward = [inverse]
+    x = [y[0] * inverse]
+
+    for m in range(1, n):
+        error_forward = sum(t(m - i) * forward[i] for i in range(m))
+        error_backward = sum(t(-i - 1) * backward[i] for i in range(m))
+        denominator = 1 - error_forward * error_backward
+        if denominator == 0:
+            raise ZeroDivisionError("Singular leading minor")
+
+        forward, backward = (
+            [
+                (f - error_forward * b) / denominator
+                for f, b in zip(forward + [0], [0] + backward)
+            ],
+            [
+                (b - error_backward * f) / denominator
+                for f, b in zip(forward + [0], [0] + backward)
+            ],
+        )
+
+        error_x = sum(t(m - i) * x[i] for i in range(m))
+        x = [
+            x_i + (y[m] - error_x) * b_i for x_i, b_i in zip(x + [0], backward)
+        ]
+
+    return x